@@ -0,0 +1,76 @@
+"""Compare peak resident memory of in-memory standard name representations.
+
+Each loader runs in a fresh interpreter so that peak RSS is not shared
+between measurements. Run with ``python benchmarks/peak_rss.py --entries 1000``.
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+
+import click
+import yaml
+
+LOADERS = {
+    "imports": "",
+    "StandardNameFile": (
+        "standardnames = StandardNameFile(filename)\n"
+        "entries = [standardnames[str(name)] for name in standardnames.data]"
+    ),
+    "CompactCatalogue.from_yaml": "catalogue = CompactCatalogue.from_yaml(filename)",
+}
+
+SCRIPT = """
+import resource
+from imas_standard_names.catalogue import CompactCatalogue
+from imas_standard_names.standard_name import StandardNameFile
+filename = {filename!r}
+{loader}
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def write_catalogue(filename: Path, entries: int):
+    """Write synthetic standard names file with the requested number of entries."""
+    units = ["m", "s", "A", "Wb", "eV", "m^-3", "m.s^-1"]
+    tags = ["equilibrium", "core_profiles", "magnetics", "pf_active"]
+    data = {
+        f"synthetic_quantity_{index}": {
+            "units": units[index % len(units)],
+            "tags": [tags[index % len(tags)]],
+            "documentation": f"Synthetic standard name number {index}. " * 4,
+        }
+        for index in range(entries)
+    }
+    with open(filename, "w") as f:
+        yaml.dump(data, f, sort_keys=False)
+
+
+def peak_rss(filename: Path, loader: str) -> int:
+    """Return peak RSS in kB of a fresh interpreter running loader."""
+    script = SCRIPT.format(filename=filename.as_posix(), loader=loader)
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    return int(result.stdout.split()[-1])
+
+
+@click.command()
+@click.option("--entries", default=1_000, help="Number of synthetic entries")
+def main(entries: int):
+    """Report peak RSS for each in-memory catalogue representation."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filename = Path(temp_dir) / "standardnames.yml"
+        write_catalogue(filename, entries)
+        baseline = peak_rss(filename, LOADERS["imports"])
+        click.echo(f"{'loader':<28}{'peak RSS [MB]':>16}{'above imports [MB]':>20}")
+        for label, loader in LOADERS.items():
+            rss = peak_rss(filename, loader)
+            click.echo(
+                f"{label:<28}{rss / 1024:>16.1f}{(rss - baseline) / 1024:>20.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
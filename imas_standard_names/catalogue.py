@@ -0,0 +1,174 @@
+from array import array
+from pathlib import Path
+import sys
+from typing import Iterable, Iterator, Mapping
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+class Entry:
+    """Read-only view of a single standard name held by a CompactCatalogue."""
+
+    __slots__ = ("_catalogue", "_index")
+
+    def __init__(self, catalogue: "CompactCatalogue", index: int):
+        """Bind view to an entry index within the catalogue."""
+        self._catalogue = catalogue
+        self._index = index
+
+    def __repr__(self) -> str:
+        """Return entry representation."""
+        return f"Entry(name={self.name!r}, units={self.units!r})"
+
+    def __eq__(self, other) -> bool:
+        """Compare entry content."""
+        if not isinstance(other, Entry):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    @property
+    def name(self) -> str:
+        """Return standard name."""
+        return self._catalogue.names[self._index]
+
+    @property
+    def units(self) -> str:
+        """Return units."""
+        return self._catalogue.units[self._index]
+
+    @property
+    def documentation(self) -> str:
+        """Return documentation sliced from the catalogue's string buffer."""
+        return self._catalogue.documentation(self._index)
+
+    @property
+    def alias(self) -> str:
+        """Return alias."""
+        return self._catalogue.aliases[self._index]
+
+    @property
+    def tags(self) -> tuple[str, ...]:
+        """Return tags."""
+        return self._catalogue.tags[self._index]
+
+    @property
+    def links(self) -> tuple[str, ...]:
+        """Return links."""
+        return self._catalogue.links[self._index]
+
+    def as_dict(self) -> dict:
+        """Return entry as a dict with StandardName keys."""
+        return {
+            "name": self.name,
+            "documentation": self.documentation,
+            "units": self.units,
+            "alias": self.alias,
+            "tags": list(self.tags),
+            "links": list(self.links),
+        }
+
+    def as_standard_name(self):
+        """Return entry as a validated StandardName instance."""
+        from imas_standard_names.standard_name import StandardName
+
+        return StandardName(
+            **{key: value or "" for key, value in self.as_dict().items()}
+        )
+
+
+class CompactCatalogue:
+    """Read-only catalogue with interned strings and one documentation buffer."""
+
+    __slots__ = (
+        "names",
+        "units",
+        "aliases",
+        "tags",
+        "links",
+        "_documentation",
+        "_offsets",
+        "_index",
+    )
+
+    def __init__(self, records: Iterable[tuple[str, Mapping]]):
+        """Build catalogue from (name, raw entry data) pairs."""
+        names, units, aliases, tags, links = [], [], [], [], []
+        documentation, offsets = [], array("L", [0])
+        tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
+        for name, data in records:
+            names.append(sys.intern(str(name)))
+            units.append(sys.intern(str(data.get("units", "none"))))
+            aliases.append(sys.intern(str(data.get("alias", ""))))
+            tags.append(self._intern_list(data.get("tags", ""), tuples))
+            links.append(self._intern_list(data.get("links", ""), tuples))
+            documentation.append(str(data.get("documentation", "")))
+            offsets.append(offsets[-1] + len(documentation[-1]))
+        self.names = tuple(names)
+        self.units = tuple(units)
+        self.aliases = tuple(aliases)
+        self.tags = tuple(tags)
+        self.links = tuple(links)
+        self._documentation = "".join(documentation)
+        self._offsets = offsets
+        self._index = {name: index for index, name in enumerate(self.names)}
+
+    @staticmethod
+    def _intern_list(
+        value: str | list[str], tuples: dict[tuple[str, ...], tuple[str, ...]]
+    ) -> tuple[str, ...]:
+        """Return shared tuple of interned strings."""
+        if isinstance(value, str):
+            value = [item.strip() for item in value.split(",")] if value else []
+        items = tuple(sys.intern(str(item)) for item in value)
+        return tuples.setdefault(items, items)
+
+    @classmethod
+    def from_file(cls, standardnames) -> "CompactCatalogue":
+        """Build catalogue from a ParseYaml or StandardNameFile instance."""
+        return cls(standardnames.data.data.items())
+
+    @classmethod
+    def from_yaml(cls, filename: str | Path) -> "CompactCatalogue":
+        """Build catalogue directly from a standard names yaml file."""
+        with open(filename, "r") as f:
+            data = yaml.load(f, Loader=SafeLoader) or {}
+        return cls(data.items())
+
+    def __len__(self) -> int:
+        """Return number of standard names."""
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        """Check if name is included in the catalogue."""
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over standard names in catalogue order."""
+        return iter(self.names)
+
+    def __getitem__(self, name: str) -> Entry:
+        """Return Entry view for the requested standard name."""
+        return Entry(self, self._index[name])
+
+    def get(self, name: str, default=None) -> Entry | None:
+        """Return Entry view for name if present, else default."""
+        if name in self._index:
+            return Entry(self, self._index[name])
+        return default
+
+    def index(self, name: str) -> int:
+        """Return position of name within the catalogue."""
+        return self._index[name]
+
+    def documentation(self, index: int) -> str:
+        """Return documentation for the entry at index."""
+        return self._documentation[self._offsets[index] : self._offsets[index + 1]]
+
+    def entries(self) -> Iterator[Entry]:
+        """Iterate over Entry views in catalogue order."""
+        return (Entry(self, index) for index in range(len(self.names)))
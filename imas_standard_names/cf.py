@@ -0,0 +1,128 @@
+from dataclasses import dataclass, field, InitVar
+from pathlib import Path
+from typing import Iterator
+import xml.etree.ElementTree as ET
+
+from imas_standard_names.messages import format_error
+from imas_standard_names.standard_name import (
+    GenericNames,
+    StandardName,
+    StandardNameFile,
+)
+from imas_standard_names import units
+
+
+@dataclass
+class CFTable:
+    """Stream entries and aliases from a CF standard name table XML file."""
+
+    input_: InitVar[str | Path]
+    filename: Path = field(init=False)
+    version: str = field(init=False, default="")
+
+    def __post_init__(self, input_: str | Path):
+        """Store path to the XML table."""
+        self.filename = Path(input_)
+
+    def __iter__(self) -> Iterator[tuple[str, dict[str, str]]]:
+        """Yield (name, raw CF data) pairs, clearing parsed elements as we go."""
+        root = None
+        for event, element in ET.iterparse(self.filename, events=("start", "end")):
+            if root is None:
+                root = element
+            if event == "start":
+                continue
+            if element.tag == "version_number":
+                self.version = (element.text or "").strip()
+            elif element.tag == "entry" and element.get("id"):
+                yield (
+                    element.get("id"),
+                    {
+                        "canonical_units": (
+                            element.findtext("canonical_units") or ""
+                        ).strip(),
+                        "description": (element.findtext("description") or "").strip(),
+                    },
+                )
+            elif element.tag == "alias" and element.get("id"):
+                yield (
+                    element.get("id"),
+                    {
+                        "entry_id": (element.findtext("entry_id") or "").strip(),
+                    },
+                )
+            else:
+                continue
+            root.clear()  # drop processed elements to keep memory bounded
+
+
+def standard_name(name: str, data: dict[str, str]) -> StandardName:
+    """Return StandardName built from a CF table entry or alias."""
+    if "entry_id" in data:
+        return StandardName(
+            name=name,
+            alias=data["entry_id"],
+            documentation=f"Alias of [`{data['entry_id']}`](#{data['entry_id']}).",
+        )
+    return StandardName(
+        name=name,
+        units=units.from_udunits(data["canonical_units"]),
+        documentation=data["description"],
+    )
+
+
+@dataclass
+class CFImport:
+    """Outcome of importing a CF standard name table."""
+
+    version: str = ""
+    added: list[str] = field(default_factory=list)
+    collisions: dict[str, str] = field(default_factory=dict)
+    skipped: dict[str, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Return number of imported standard names."""
+        return len(self.added)
+
+
+def import_cf(
+    cf_file: str | Path,
+    standardnames: StandardNameFile,
+    genericnames: GenericNames | None = None,
+    overwrite: bool = False,
+    aliases: bool = True,
+    update_file: bool = True,
+) -> CFImport:
+    """Import CF standard names with a single write of the standard names file.
+
+    Names already in the standard names file are reported as collisions unless
+    overwrite is set, names in the generic names list are always reported and
+    entries whose units or names fail validation are skipped.
+    """
+    table, result = CFTable(cf_file), CFImport()
+    existing = {str(name) for name in standardnames.data}
+    generic = set(genericnames.names) if genericnames is not None else set()
+    batch = []
+    for name, data in table:
+        if not aliases and "entry_id" in data:
+            continue
+        if name in generic:
+            result.collisions[name] = f"**{name}** is a generic name."
+            continue
+        if name in existing and not overwrite:
+            result.collisions[name] = (
+                f"**{name}** is already present in {standardnames.filename}."
+            )
+            continue
+        try:
+            batch.append(standard_name(name, data))
+        except Exception as error:
+            result.skipped[name] = format_error(error)
+    result.version = table.version
+    errors = standardnames.update_batch(
+        batch, overwrite=overwrite, update_file=update_file and bool(batch)
+    )
+    for name, error in errors.items():
+        result.skipped[name] = format_error(error)
+    result.added = [entry.name for entry in batch if entry.name not in errors]
+    return result
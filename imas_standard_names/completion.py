@@ -0,0 +1,135 @@
+from array import array
+from bisect import bisect_left
+import csv
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import sys
+from typing import ClassVar, Iterable
+
+import yaml
+
+from imas_standard_names.catalogue import SafeLoader
+from imas_standard_names.layout import file_stamp, yaml_blocks
+
+
+def cache_dir() -> Path:
+    """Return directory holding cached completion indices."""
+    return (
+        Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+        / "imas-standard-names"
+    )
+
+
+def scan_names(filename: str | Path) -> list[str]:
+    """Return top-level names from a standard names file without a full parse."""
+    with open(filename, "r") as f:
+        text = f.read()
+    if (blocks := yaml_blocks(text)) is not None:
+        return list(blocks)
+    return [str(name) for name in yaml.load(text, Loader=SafeLoader) or {}]
+
+
+def scan_generic_names(filename: str | Path) -> list[str]:
+    """Return generic names from a generic names csv file without pandas."""
+    with open(filename, "r", newline="") as f:
+        return [row["Generic Name"] for row in csv.DictReader(f)]
+
+
+class NameIndex:
+    """Sorted name array with a word-boundary suffix array for completion."""
+
+    __slots__ = ("names", "suffixes")
+
+    SHIFT: ClassVar[int] = 16  # suffix entries pack name number and character offset
+
+    def __init__(self, names: Iterable[str]):
+        """Sort names and the suffixes starting at each inner underscore word."""
+        self.names = sorted(set(names))
+        suffixes = (
+            number << self.SHIFT | match.end()
+            for number, name in enumerate(self.names)
+            for match in re.finditer("_", name)
+        )
+        self.suffixes = array("Q", sorted(suffixes, key=self._suffix))
+
+    def __len__(self) -> int:
+        """Return number of indexed names."""
+        return len(self.names)
+
+    def _suffix(self, entry: int) -> str:
+        """Return name suffix referenced by a suffix array entry."""
+        return self.names[entry >> self.SHIFT][entry & ((1 << self.SHIFT) - 1) :]
+
+    def complete(self, incomplete: str, limit: int = 50) -> list[str]:
+        """Return names completing the incomplete text, prefix matches first.
+
+        Names with an inner underscore-separated word starting with the text
+        follow the prefix matches, so ``field`` completes ``radial_magnetic_field``.
+        """
+        matches = []
+        for number in range(bisect_left(self.names, incomplete), len(self.names)):
+            if len(matches) == limit or not self.names[number].startswith(incomplete):
+                break
+            matches.append(self.names[number])
+        if not incomplete or len(matches) == limit:
+            return matches
+        prefixed, seen = len(matches), set(matches)
+        start = bisect_left(self.suffixes, incomplete, key=self._suffix)
+        for number in range(start, len(self.suffixes)):
+            entry = self.suffixes[number]
+            if len(matches) == limit or not self._suffix(entry).startswith(incomplete):
+                break
+            if (name := self.names[entry >> self.SHIFT]) not in seen:
+                seen.add(name)
+                matches.append(name)
+        matches[prefixed:] = sorted(matches[prefixed:])
+        return matches
+
+    @staticmethod
+    def artifact(filename: str | Path) -> Path:
+        """Return cache path of the index built for a file."""
+        key = hashlib.sha256(os.fsencode(Path(filename).resolve())).hexdigest()
+        return cache_dir() / f"{key[:32]}.index"
+
+    def dump(self, filename: Path, stamp: list[int]):
+        """Write index as a json header, the name block and the raw suffix array."""
+        names = "\n".join(self.names).encode()
+        header = {"stamp": stamp, "names": len(names), "byteorder": sys.byteorder}
+        with open(filename, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            f.write(names)
+            self.suffixes.tofile(f)
+
+    @classmethod
+    def load(cls, filename: Path, stamp: list[int]) -> "NameIndex | None":
+        """Return index read from an artifact, or None if the artifact is stale."""
+        with open(filename, "rb") as f:
+            header = json.loads(f.readline())
+            if header["stamp"] != stamp or header["byteorder"] != sys.byteorder:
+                return None
+            index = cls.__new__(cls)
+            names = f.read(header["names"]).decode()
+            index.names = names.split("\n") if names else []
+            index.suffixes = array("Q", f.read())
+        return index
+
+    @classmethod
+    def from_file(cls, filename: str | Path) -> "NameIndex":
+        """Load index from its cached artifact, rebuilding it when stale."""
+        stamp, artifact = list(file_stamp(filename)), cls.artifact(filename)
+        try:
+            if (index := cls.load(artifact, stamp)) is not None:
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+        index = cls(scan_names(filename))
+        try:
+            artifact.parent.mkdir(parents=True, exist_ok=True)
+            index.dump(artifact.with_suffix(f".{os.getpid()}.tmp"), stamp)
+            os.replace(artifact.with_suffix(f".{os.getpid()}.tmp"), artifact)
+        except OSError:  # read-only cache, keep the in-memory index
+            pass
+        return index
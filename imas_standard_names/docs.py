@@ -0,0 +1,195 @@
+from dataclasses import dataclass, field, InitVar
+import hashlib
+import json
+from pathlib import Path
+from typing import ClassVar
+
+from imas_standard_names.standard_name import (
+    ParseYaml,
+    StandardName,
+    StandardNameFile,
+    entry_hash,
+)
+
+
+@dataclass
+class DocsGenerator:
+    """Generate markdown fragments, rewriting only entries whose hash changed."""
+
+    standardnames: ParseYaml
+    input_: InitVar[str | Path]
+    path: Path = field(init=False)
+
+    unit_formats: ClassVar[list[str]] = ["~F", "~L"]
+
+    def __post_init__(self, input_: str | Path):
+        """Set output directory."""
+        self.path = Path(input_)
+
+    @property
+    def manifest_file(self) -> Path:
+        """Return manifest file path."""
+        return self.path / "manifest.json"
+
+    def load_manifest(self) -> dict:
+        """Return manifest from previous build."""
+        try:
+            with open(self.manifest_file, "r") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = {}
+        if "units" not in manifest:  # missing or written by an older release
+            return {"names": {}, "tags": {}, "units": {}, "index": ""}
+        return manifest
+
+    @classmethod
+    def render_units(cls, units: str) -> dict[str, str]:
+        """Return units rendered with each unit format."""
+        if units in ["", "none"]:
+            return {unit_format: "" for unit_format in cls.unit_formats}
+        return {
+            unit_format: StandardName.parse_units(f"{units}:{unit_format}")
+            for unit_format in cls.unit_formats
+        }
+
+    @staticmethod
+    def render_name(standard_name: str, data: dict, record: dict, units: str) -> str:
+        """Return markdown page for a single standard name."""
+        lines = [f"# `{standard_name}`", "", f"- _units_: {units or 'dimensionless'}"]
+        if record["tags"]:
+            tags = ", ".join(f"[{tag}](../tags/{tag}.md)" for tag in record["tags"])
+            lines.append(f"- _tags_: {tags}")
+        if data.get("alias"):
+            lines.append(f"- _alias_: [`{data['alias']}`]({data['alias']}.md)")
+        return "\n".join(lines + ["", data["documentation"].strip(), ""])
+
+    @staticmethod
+    def render_tag(tag: str, names: dict[str, str]) -> str:
+        """Return markdown page listing the standard names with a given tag."""
+        lines = [f"# `{tag}`", ""]
+        for standard_name, units in names.items():
+            units = units or "dimensionless"
+            lines.append(f"- [`{standard_name}`](../names/{standard_name}.md): {units}")
+        return "\n".join(lines + [""])
+
+    @staticmethod
+    def render_index(names: dict[str, str], tags: list[str]) -> str:
+        """Return catalogue page linking every tag and standard name page."""
+        lines = ["# Standard name catalogue", "", "## Tags", ""]
+        lines.extend(f"- [`{tag}`](tags/{tag}.md)" for tag in tags)
+        lines.extend(["", "## Standard names", ""])
+        for standard_name, units in names.items():
+            units = units or "dimensionless"
+            lines.append(f"- [`{standard_name}`](names/{standard_name}.md): {units}")
+        return "\n".join(lines + [""])
+
+    @staticmethod
+    def digest(items) -> str:
+        """Return content hash of a JSON serializable listing."""
+        return hashlib.sha256(json.dumps(items).encode()).hexdigest()
+
+    def _write(self, filename: Path, content: str):
+        """Write fragment to file, creating parent directories as required."""
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        with open(filename, "w") as f:
+            f.write(content)
+
+    def generate(self) -> dict[str, list[Path]]:
+        """Write changed fragments and return written and removed file paths."""
+        manifest = self.load_manifest()
+        changes: dict[str, list[Path]] = {"written": [], "removed": []}
+        names, units = {}, {}
+        for standard_name, data in self.standardnames.data.data.items():
+            record = manifest["names"].get(standard_name, {})
+            source = data.get("units", "none")
+            if source not in units:
+                units[source] = manifest["units"].get(source) or self.render_units(
+                    source
+                )
+            filename = self.path / "names" / f"{standard_name}.md"
+            content_hash = entry_hash(standard_name, data)
+            if record.get("hash") == content_hash and filename.exists():
+                names[standard_name] = record
+                continue
+            tags = StandardName.parse_list(data.get("tags", ""))
+            names[standard_name] = record = {
+                "hash": content_hash,
+                "units": source,
+                "tags": tags or [],
+            }
+            self._write(
+                filename,
+                self.render_name(standard_name, data, record, units[source]["~L"]),
+            )
+            changes["written"].append(filename)
+        for standard_name in manifest["names"].keys() - names.keys():
+            filename = self.path / "names" / f"{standard_name}.md"
+            filename.unlink(missing_ok=True)
+            changes["removed"].append(filename)
+
+        members: dict[str, dict[str, dict]] = {}
+        for standard_name, record in sorted(names.items()):
+            for tag in record["tags"]:
+                members.setdefault(tag, {})[standard_name] = record
+        tags = {}
+        for tag, tag_names in members.items():
+            filename = self.path / "tags" / f"{tag}.md"
+            tags[tag] = self.digest(
+                [(name, record["hash"]) for name, record in tag_names.items()]
+            )
+            if manifest["tags"].get(tag) == tags[tag] and filename.exists():
+                continue
+            self._write(
+                filename,
+                self.render_tag(
+                    tag,
+                    {
+                        name: units[record["units"]]["~L"]
+                        for name, record in tag_names.items()
+                    },
+                ),
+            )
+            changes["written"].append(filename)
+        for tag in manifest["tags"].keys() - tags.keys():
+            filename = self.path / "tags" / f"{tag}.md"
+            filename.unlink(missing_ok=True)
+            changes["removed"].append(filename)
+
+        index = self.digest(
+            [
+                sorted(tags),
+                [(name, record["units"]) for name, record in sorted(names.items())],
+            ]
+        )
+        filename = self.path / "index.md"
+        if manifest.get("index") != index or not filename.exists():
+            self._write(
+                filename,
+                self.render_index(
+                    {
+                        name: units[record["units"]]["~L"]
+                        for name, record in sorted(names.items())
+                    },
+                    sorted(tags),
+                ),
+            )
+            changes["written"].append(filename)
+
+        if changes["written"] or changes["removed"]:
+            self._write(
+                self.manifest_file,
+                json.dumps(
+                    {"names": names, "tags": tags, "units": units, "index": index},
+                    indent=2,
+                    sort_keys=True,
+                ),
+            )
+        return changes
+
+
+def on_pre_build(config):
+    """Regenerate changed fragments before a mkdocs build (mkdocs hook)."""
+    standardnames = Path(config["config_file_path"]).parent / "standardnames.yml"
+    DocsGenerator(
+        StandardNameFile(standardnames), Path(config["docs_dir"]) / "generated"
+    ).generate()
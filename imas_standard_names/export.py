@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+from typing import IO, Iterator
+
+from imas_standard_names.catalogue import CompactCatalogue
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+
+def _require_msgpack():
+    """Raise ImportError if the optional msgpack dependency is not installed."""
+    if msgpack is None:  # pragma: no cover
+        raise ImportError(
+            "The msgpack format requires the optional msgpack package. "
+            "Install with `pip install imas-standard-names[export]`."
+        )
+
+
+def records(source) -> Iterator[dict]:
+    """Yield plain dict records from a ParseYaml instance or CompactCatalogue."""
+    if not isinstance(source, CompactCatalogue):
+        source = CompactCatalogue.from_file(source)
+    return (entry.as_dict() for entry in source.entries())
+
+
+def dump_jsonl(source, fp: IO[str]):
+    """Stream catalogue to fp as JSON Lines, one standard name per line."""
+    for record in records(source):
+        fp.write(json.dumps(record, separators=(",", ":")))
+        fp.write("\n")
+
+
+def load_jsonl(fp: IO[str]) -> CompactCatalogue:
+    """Load catalogue from JSON Lines."""
+    data = (json.loads(line) for line in fp if line.strip())
+    return CompactCatalogue((record["name"], record) for record in data)
+
+
+def dump_json(source, fp: IO[str]):
+    """Write catalogue to fp as a single JSON document keyed by standard name."""
+    fp.write("{")
+    for index, record in enumerate(records(source)):
+        name = record.pop("name")
+        fp.write(f"{',' if index else ''}{json.dumps(name)}:")
+        fp.write(json.dumps(record, separators=(",", ":")))
+    fp.write("}")
+
+
+def load_json(fp: IO[str]) -> CompactCatalogue:
+    """Load catalogue from a single JSON document."""
+    return CompactCatalogue(json.load(fp).items())
+
+
+def dump_msgpack(source, fp: IO[bytes]):
+    """Stream catalogue to fp as a sequence of msgpack records."""
+    _require_msgpack()
+    packer = msgpack.Packer()
+    for record in records(source):
+        fp.write(packer.pack(record))
+
+
+def load_msgpack(fp: IO[bytes]) -> CompactCatalogue:
+    """Load catalogue from a sequence of msgpack records."""
+    _require_msgpack()
+    unpacker = msgpack.Unpacker(fp, raw=False)
+    return CompactCatalogue((record["name"], record) for record in unpacker)
+
+
+FORMATS = {
+    ".jsonl": (dump_jsonl, load_jsonl, ""),
+    ".json": (dump_json, load_json, ""),
+    ".msgpack": (dump_msgpack, load_msgpack, "b"),
+}
+
+
+def _format(filename: str | Path):
+    """Return exporter, loader and file mode for the filename suffix."""
+    try:
+        return FORMATS[Path(filename).suffix]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported export format {Path(filename).suffix!r}, "
+            f"expected one of {list(FORMATS)}."
+        )
+
+
+def dump(source, filename: str | Path):
+    """Export catalogue to file in the format given by its suffix."""
+    exporter, _, mode = _format(filename)
+    with open(filename, f"w{mode}") as f:
+        exporter(source, f)
+
+
+def load(filename: str | Path) -> CompactCatalogue:
+    """Load catalogue from file in the format given by its suffix."""
+    _, loader, mode = _format(filename)
+    with open(filename, f"r{mode}") as f:
+        return loader(f)
@@ -0,0 +1,36 @@
+import os
+from pathlib import Path
+import re
+
+TOP_LEVEL_KEY = re.compile(r"(?P<name>[^\s#:\-.{\[\"'!&*|>%@`][^:#]*?):(?:[ \t]|$)")
+
+
+def yaml_blocks(text: str) -> dict[str, tuple[int, int]] | None:
+    """Return character span of each top-level block, or None if ambiguous.
+
+    A block starts at an unindented mapping key and runs up to the next one.
+    Layouts that cannot be split safely on line boundaries, such as comments,
+    document markers, flow style or duplicate keys at column zero, return None.
+    """
+    blocks: dict[str, tuple[int, int]] = {}
+    name, start, offset = None, 0, 0
+    for line in re.findall(r"[^\n]*\n|[^\n]+", text):
+        if line.strip() and not line[0].isspace():
+            match = TOP_LEVEL_KEY.match(line)
+            if match is None or match["name"] in blocks or match["name"] == name:
+                return None
+            if name is not None:
+                blocks[name] = (start, offset)
+            name, start = match["name"], offset
+        elif name is None and line.strip():
+            return None
+        offset += len(line)
+    if name is not None:
+        blocks[name] = (start, offset)
+    return blocks
+
+
+def file_stamp(file: int | str | Path) -> tuple[int, int, int]:
+    """Return (size, mtime_ns, inode) stamp of a file path or descriptor."""
+    stat = os.stat(file)
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
@@ -0,0 +1,176 @@
+import csv
+from dataclasses import dataclass, field
+from pathlib import Path
+import re
+from typing import ClassVar, Iterable, Iterator, Mapping
+import xml.etree.ElementTree as ET
+
+INDEX = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+
+
+def normalize(path: str) -> str:
+    """Return Data Dictionary path stripped of array indices and separators.
+
+    ``equilibrium.time_slice[0].profiles_1d.psi`` and
+    ``equilibrium/time_slice(itime)/profiles_1d/psi`` both normalize to
+    ``equilibrium/time_slice/profiles_1d/psi``.
+    """
+    path = INDEX.sub("", path).replace(".", "/")
+    return "/".join(
+        segment for segment in path.split("/") if segment and not segment.isdigit()
+    )
+
+
+class _Node:
+    """Prefix tree node keyed by path segment."""
+
+    __slots__ = ("children", "standard_name")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.standard_name: str | None = None
+
+
+@dataclass
+class PathIndex:
+    """Map IMAS Data Dictionary paths to standard names and back."""
+
+    paths: dict[str, str] = field(default_factory=dict)
+    names: dict[str, list[str]] = field(init=False, repr=False, default_factory=dict)
+    _root: _Node = field(init=False, repr=False, default_factory=_Node)
+
+    columns: ClassVar[tuple[str, str]] = ("Path", "Standard Name")
+
+    def __post_init__(self):
+        """Build reverse map and prefix tree from path mapping."""
+        paths, self.paths = self.paths, {}
+        for path, standard_name in paths.items():
+            self.add(path, standard_name)
+
+    def add(self, path: str, standard_name: str):
+        """Map Data Dictionary path to standard name."""
+        path = normalize(path)
+        if (previous := self.paths.get(path)) is not None:
+            if previous == standard_name:
+                return
+            raise KeyError(
+                f"The path **{path}** is already mapped to **{previous}**, "
+                f"not **{standard_name}**."
+            )
+        self.paths[path] = standard_name
+        self.names.setdefault(standard_name, []).append(path)
+        node = self._root
+        for segment in path.split("/"):
+            node = node.children.setdefault(segment, _Node())
+        node.standard_name = standard_name
+
+    def __len__(self) -> int:
+        """Return number of mapped paths."""
+        return len(self.paths)
+
+    def __contains__(self, path: str) -> bool:
+        """Check if path is mapped to a standard name."""
+        return path in self.paths or normalize(path) in self.paths
+
+    def __getitem__(self, path: str) -> str:
+        """Return standard name mapped to a Data Dictionary path."""
+        try:
+            return self.paths[path]
+        except KeyError:
+            return self.paths[normalize(path)]
+
+    def get(self, path: str, default: str | None = None) -> str | None:
+        """Return standard name mapped to path, or default."""
+        try:
+            return self[path]
+        except KeyError:
+            return default
+
+    def paths_of(self, standard_name: str) -> list[str]:
+        """Return Data Dictionary paths mapped to a standard name."""
+        return self.names.get(standard_name, [])
+
+    def under(self, prefix: str = "") -> Iterator[tuple[str, str]]:
+        """Yield (path, standard name) pairs for every mapped path below prefix."""
+        node, prefix = self._root, normalize(prefix)
+        for segment in prefix.split("/") if prefix else []:
+            if (node := node.children.get(segment)) is None:
+                return
+        stack = [(prefix, node)]
+        while stack:
+            path, node = stack.pop()
+            if node.standard_name is not None:
+                yield path, node.standard_name
+            stack.extend(
+                (f"{path}/{segment}" if path else segment, child)
+                for segment, child in reversed(node.children.items())
+            )
+
+    def annotate(self, paths: Iterable[str]) -> Iterator[tuple[str, str | None]]:
+        """Yield each path together with its standard name, or None."""
+        return ((path, self.get(path)) for path in paths)
+
+    def missing(self, standard_names: Iterable[str]) -> list[str]:
+        """Return mapped standard names that are not in standard_names."""
+        return sorted(self.names.keys() - set(standard_names))
+
+    @classmethod
+    def from_csv(cls, filename: str | Path) -> "PathIndex":
+        """Load index from a Path, Standard Name mapping table."""
+        index = cls()
+        with open(filename, "r", newline="") as f:
+            for row in csv.DictReader(f):
+                index.add(row[index.columns[0]], row[index.columns[1]])
+        return index
+
+    def to_csv(self, filename: str | Path):
+        """Write index as a Path, Standard Name mapping table sorted by path."""
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            writer.writerows(sorted(self.paths.items()))
+
+    @classmethod
+    def from_dd_xml(
+        cls,
+        filename: str | Path,
+        mapping: Mapping[str, str] | None = None,
+        attribute: str = "standard_name",
+    ) -> "PathIndex":
+        """Build index from a local Data Dictionary XML file.
+
+        Fields carrying the standard_name attribute are indexed directly and
+        entries from an optional path mapping are checked against the paths
+        defined in the Data Dictionary.
+        """
+        index, dd_paths = cls(), set()
+        ids_name, stack = None, []
+        for event, element in ET.iterparse(filename, events=("start", "end")):
+            if element.tag == "IDS":
+                if event == "start":
+                    ids_name = element.get("name")
+                else:
+                    ids_name = None
+                    element.clear()
+                continue
+            if element.tag != "field" or ids_name is None:
+                continue
+            if event == "start":
+                stack.append(element.get("name"))
+                continue
+            path = normalize(f"{ids_name}/{element.get('path') or '/'.join(stack)}")
+            stack.pop()
+            dd_paths.add(path)
+            if standard_name := element.get(attribute):
+                index.add(path, standard_name)
+        unknown = sorted(
+            path for path in (mapping or {}) if normalize(path) not in dd_paths
+        )
+        if unknown:
+            raise KeyError(
+                f"The mapped paths {', '.join(f'**{path}**' for path in unknown)} "
+                f"are not defined in {filename}."
+            )
+        for path, standard_name in (mapping or {}).items():
+            index.add(path, standard_name)
+        return index
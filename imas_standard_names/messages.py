@@ -0,0 +1,40 @@
+from io import StringIO
+import json
+from typing import TYPE_CHECKING
+
+from strictyaml.ruamel import YAML
+
+if TYPE_CHECKING:  # pragma: no cover
+    from imas_standard_names.standard_name import StandardName
+
+yaml = YAML()
+yaml.indent(mapping=2, sequence=4, offset=2)
+yaml.preserve_quotes = True
+yaml.width = 80  # Line width
+
+
+def format_error(error, submission_file=None):
+    """Return formatted error message."""
+    error_message = f"**{type(error).__name__}**: {error}"
+    if submission_file:
+        with open(submission_file, "r") as f:
+            submission = json.load(f)
+        yaml_str = StringIO()
+        yaml.dump(submission, yaml_str)
+        error_message = (
+            ":boom: The proposed Standard Name is not valid.\n"
+            f"\n{error_message}\n"
+            "\n:pencil: Please correct the error by editing the Issue Body at the top of the page.\n"
+            f"\n{yaml_str.getvalue()}\n"
+        )
+    return error_message
+
+
+def format_success(standard_name: "StandardName") -> str:
+    """Return formatted message for a valid proposal."""
+    return (
+        ":sparkles: This proposal is ready for submission to "
+        "the Standard Names repository.\n"
+        f"\n{standard_name.as_yaml()}\n"
+        ":label: Label issue with `approve` to commit."
+    )
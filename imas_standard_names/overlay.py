@@ -0,0 +1,84 @@
+from dataclasses import dataclass, field, InitVar
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from imas_standard_names.standard_name import (
+    ParseYaml,
+    StandardName,
+    StandardNameFile,
+)
+
+
+@dataclass
+class OverlayCatalogue:
+    """Stack standard name sources, highest priority first, without merging."""
+
+    input_: InitVar[Iterable[ParseYaml | str | Path]]
+    layers: list[ParseYaml] = field(init=False)
+    _index: dict[str, tuple[int, ...]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    def __post_init__(self, input_: Iterable[ParseYaml | str | Path]):
+        """Load layers and build the merged membership index."""
+        self.layers = [
+            layer if isinstance(layer, ParseYaml) else StandardNameFile(layer)
+            for layer in input_
+        ]
+        self.reindex()
+
+    def reindex(self):
+        """Rebuild the name to layer index after a layer has been modified."""
+        index: dict[str, list[int]] = {}
+        for number, layer in enumerate(self.layers):
+            for name in layer.data:
+                index.setdefault(str(name), []).append(number)
+        self._index = {name: tuple(layers) for name, layers in index.items()}
+
+    def __len__(self) -> int:
+        """Return number of distinct standard names across all layers."""
+        return len(self._index)
+
+    def __contains__(self, standard_name: str) -> bool:
+        """Check if any layer defines standard name."""
+        return standard_name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over distinct standard names in priority order."""
+        return iter(self._index)
+
+    def layer(self, standard_name: str) -> ParseYaml:
+        """Return the highest priority layer that defines standard name."""
+        return self.layers[self._index[standard_name][0]]
+
+    def links(self, standard_name: str) -> list[str]:
+        """Return union of links from every layer that defines standard name."""
+        links: dict[str, None] = {}
+        for number in self._index[standard_name]:
+            value = self.layers[number].data[standard_name].data.get("links", [])
+            links.update(dict.fromkeys([value] if isinstance(value, str) else value))
+        links.pop("", None)
+        return list(links)
+
+    def __getitem__(self, standard_name: str) -> StandardName:
+        """Return standard name resolved from the first layer that defines it."""
+        entry = self.layer(standard_name)[standard_name]
+        if len(self._index[standard_name]) > 1:
+            entry.links = self.links(standard_name)
+        return entry
+
+    def get(
+        self, standard_name: str, default: StandardName | None = None
+    ) -> StandardName | None:
+        """Return resolved standard name, or default if no layer defines it."""
+        if standard_name not in self._index:
+            return default
+        return self[standard_name]
+
+    def shadowed(self) -> dict[str, list[int]]:
+        """Return names defined by more than one layer with their layer numbers."""
+        return {
+            name: list(layers)
+            for name, layers in self._index.items()
+            if len(layers) > 1
+        }
@@ -1,36 +1,12 @@
-from io import StringIO
+import os
+import threading
+from typing import Callable, Iterator, TextIO
 
 import click
 import json
-from strictyaml.ruamel import YAML
 
-from imas_standard_names.standard_name import (
-    GenericNames,
-    StandardInput,
-    StandardNameFile,
-)
-
-yaml = YAML()
-yaml.indent(mapping=2, sequence=4, offset=2)
-yaml.preserve_quotes = True
-yaml.width = 80  # Line width
-
-
-def format_error(error, submission_file=None):
-    """Return formatted error message."""
-    error_message = f"**{type(error).__name__}**: {error}"
-    if submission_file:
-        with open(submission_file, "r") as f:
-            submission = json.load(f)
-        yaml_str = StringIO()
-        yaml.dump(submission, yaml_str)
-        error_message = (
-            ":boom: The proposed Standard Name is not valid.\n"
-            f"\n{error_message}\n"
-            "\n:pencil: Please correct the error by editing the Issue Body at the top of the page.\n"
-            f"\n{yaml_str.getvalue()}\n"
-        )
-    return error_message
+# heavy imports are deferred into command bodies to keep shell completion fast
+from imas_standard_names.completion import NameIndex, scan_generic_names
 
 
 @click.command()
@@ -51,6 +27,13 @@ def update_standardnames(
     overwrite: bool,
 ):
     """Add a standard name to the project's standard name file."""
+    from imas_standard_names.messages import format_error, format_success
+    from imas_standard_names.standard_name import (
+        GenericNames,
+        StandardInput,
+        StandardNameFile,
+    )
+
     standardnames = StandardNameFile(standardnames_file, unit_format=unit_format)
     genericnames = GenericNames(genericnames_file)
     try:
@@ -63,40 +46,130 @@ def update_standardnames(
     except (NameError, KeyError, Exception) as error:
         click.echo(format_error(error, submission_file))
     else:
-        click.echo(
-            ":sparkles: This proposal is ready for submission to "
-            "the Standard Names repository.\n"
-            f"\n{standardnames[standard_name.name].as_yaml()}\n"
-            ":label: Label issue with `approve` to commit."
+        click.echo(format_success(standardnames[standard_name.name]))
+
+
+def read_batch(batch: TextIO) -> Iterator[tuple[str, Exception | None]]:
+    """Yield (name, error) pairs from newline-delimited text or JSON Lines.
+
+    Malformed lines are yielded verbatim with the error that rejected them.
+    """
+    for line in batch:
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] in '{"':
+            try:
+                value = json.loads(line)
+                if isinstance(value, dict):
+                    value = value["name"]
+                if not isinstance(value, str):
+                    raise TypeError(
+                        f"Expected a name string, not {type(value).__name__}."
+                    )
+            except (ValueError, KeyError, TypeError) as error:
+                yield line, error
+                continue
+            line = value
+        yield line, None
+
+
+def echo_batch(batch: TextIO, lookup: Callable[[str], object]):
+    """Echo one JSON result or error record per batch line."""
+    from imas_standard_names.messages import format_error
+
+    for name, error in read_batch(batch):
+        if error is None:
+            try:
+                result = {"name": name, "result": lookup(name)}
+            except (KeyError, Exception) as lookup_error:
+                error = lookup_error
+        if error is not None:
+            result = {"name": name, "error": format_error(error)}
+        click.echo(json.dumps(result))
+
+
+def complete_standardname(ctx: click.Context, param: click.Parameter, incomplete: str):
+    """Complete standard names from the cached index of the standard names file."""
+    try:
+        return NameIndex.from_file(ctx.params["standardnames_file"]).complete(
+            incomplete
         )
+    except (KeyError, OSError):
+        return []
+
+
+def complete_genericname(ctx: click.Context, param: click.Parameter, incomplete: str):
+    """Complete generic names from the generic names file."""
+    try:
+        names = scan_generic_names(ctx.params["genericnames_file"])
+    except (KeyError, OSError):
+        return []
+    return NameIndex(names).complete(incomplete)
+
+
+batch_option = click.option(
+    "--batch",
+    type=click.File("r"),
+    default=None,
+    help="Read names from a file, or '-' for stdin, and stream JSON results",
+)
 
 
 @click.command()
 @click.argument("standardnames_file")
-@click.argument("standard_name", nargs=-1)  # handle whitespace in standard name
-def has_standardname(standardnames_file: str, standard_name: str):
+# nargs=-1 to handle whitespace in standard name
+@click.argument("standard_name", nargs=-1, shell_complete=complete_standardname)
+@batch_option
+def has_standardname(standardnames_file: str, standard_name: str, batch: TextIO | None):
     """Check if a standard name exists in the project's standard name file."""
+    from imas_standard_names.standard_name import StandardNameFile
+
     standardnames = StandardNameFile(standardnames_file)
+    if batch:
+        names = set(standardnames.data.data)
+        echo_batch(batch, names.__contains__)
+        return
     standard_name = " ".join(standard_name)
     click.echo(f"{standard_name in standardnames.data}")
 
 
 @click.command()
 @click.argument("genericnames_file")
-@click.argument("standard_name", nargs=-1)
-def is_genericname(genericnames_file: str, standard_name: str):
+@click.argument("standard_name", nargs=-1, shell_complete=complete_genericname)
+@batch_option
+def is_genericname(genericnames_file: str, standard_name: str, batch: TextIO | None):
     """Check if a standard name is already present in the generic names file."""
+    from imas_standard_names.standard_name import GenericNames
+
+    genericnames = GenericNames(genericnames_file)
+    if batch:
+        names = set(genericnames.names)
+        echo_batch(batch, names.__contains__)
+        return
     standard_name = " ".join(standard_name)
-    click.echo(f"{standard_name in GenericNames(genericnames_file)}")
+    click.echo(f"{standard_name in genericnames}")
 
 
 @click.command()
 @click.argument("standardnames_file")
-@click.argument("standard_name", nargs=-1)
+@click.argument("standard_name", nargs=-1, shell_complete=complete_standardname)
 @click.option("--unit-format", default="~F", help="Pint unit string formatter")
-def get_standardname(standardnames_file: str, standard_name: str, unit_format: str):
+@batch_option
+def get_standardname(
+    standardnames_file: str,
+    standard_name: str,
+    unit_format: str,
+    batch: TextIO | None,
+):
     """Return the standard name entry from the project's standard name file."""
+    from imas_standard_names.messages import format_error
+    from imas_standard_names.standard_name import StandardNameFile
+
     standardnames = StandardNameFile(standardnames_file, unit_format=unit_format)
+    if batch:
+        echo_batch(batch, lambda name: standardnames[name].model_dump())
+        return
     standard_name = " ".join(standard_name)
     try:
         submission = standardnames[standard_name].as_document()[standard_name].as_yaml()
@@ -104,3 +177,249 @@ def get_standardname(standardnames_file: str, standard_name: str, unit_format: s
         click.echo(format_error(error))
     else:
         click.echo(submission)
+
+
+@click.command()
+@click.argument("spool_dir")
+@click.argument("submission_file")
+@click.option("--issue-link", default="")
+@click.option(
+    "--overwrite", default=False, is_flag=True, help="Overwrite existing entry"
+)
+def queue_standardname(
+    spool_dir: str, submission_file: str, issue_link: str, overwrite: bool
+):
+    """Spool an approved submission for a later coalesced update."""
+    from imas_standard_names.spool import SubmissionQueue
+
+    SubmissionQueue(spool_dir).put(
+        submission_file, issue_link=issue_link, overwrite=overwrite
+    )
+    click.echo(f":inbox_tray: Queued {submission_file} for submission.")
+
+
+@click.command()
+@click.argument("spool_dir")
+@click.argument("standardnames_file")
+@click.argument("genericnames_file")
+@click.option("--unit-format", default="~F", help="Pint unit string formatter")
+@click.option(
+    "--commit", default=False, is_flag=True, help="Commit the updated file with git"
+)
+def drain_standardnames(
+    spool_dir: str,
+    standardnames_file: str,
+    genericnames_file: str,
+    unit_format: str,
+    commit: bool,
+):
+    """Apply all spooled submissions to the project's standard name file."""
+    from imas_standard_names.messages import format_error
+    from imas_standard_names.spool import SubmissionQueue
+
+    drained = SubmissionQueue(spool_dir).drain(
+        standardnames_file, genericnames_file, unit_format=unit_format
+    )
+    for submission_file, error in drained.errors.items():
+        click.echo(format_error(error, submission_file))
+    if not drained:
+        return
+    if commit:
+        drained.commit(standardnames_file)
+    click.echo(drained.commit_message)
+
+
+@click.command()
+@click.argument("standardnames_file")
+@click.argument("output_dir")
+def generate_docs(standardnames_file: str, output_dir: str):
+    """Generate documentation fragments for changed standard names."""
+    from imas_standard_names.docs import DocsGenerator
+    from imas_standard_names.standard_name import StandardNameFile
+
+    changes = DocsGenerator(StandardNameFile(standardnames_file), output_dir).generate()
+    click.echo(
+        f"{len(changes['written'])} fragments written, "
+        f"{len(changes['removed'])} fragments removed."
+    )
+
+
+@click.command()
+@click.argument("standardnames_file")
+@click.argument("output_file")
+def export_standardnames(standardnames_file: str, output_file: str):
+    """Export the standard name file as JSON Lines, JSON or msgpack."""
+    from imas_standard_names.catalogue import CompactCatalogue
+    from imas_standard_names import export
+
+    catalogue = CompactCatalogue.from_yaml(standardnames_file)
+    export.dump(catalogue, output_file)
+    click.echo(f"Exported {len(catalogue)} standard names to {output_file}.")
+
+
+@click.command()
+@click.argument("standardnames_file")
+@click.argument("image_file")
+def publish_standardnames(standardnames_file: str, image_file: str):
+    """Publish an immutable catalogue image for memory-mapped worker lookups."""
+    from imas_standard_names.catalogue import CompactCatalogue
+    from imas_standard_names.shared import publish, SharedCatalogue
+
+    publish(CompactCatalogue.from_yaml(standardnames_file), image_file)
+    with SharedCatalogue.attach(image_file) as catalogue:
+        click.echo(
+            f"Published {len(catalogue)} standard names to {image_file} "
+            f"(stamp {catalogue.stamp[1][:12]})."
+        )
+
+
+@click.command()
+@click.argument("repository")
+@click.argument("store_dir")
+@click.option("--path", default="standardnames.yml", help="Standard name file path")
+def snapshot_standardnames(repository: str, store_dir: str, path: str):
+    """Import the git history of the standard name file into a snapshot store."""
+    from imas_standard_names.snapshot import SnapshotStore
+
+    store = SnapshotStore(store_dir)
+    imported = store.import_git(repository, path)
+    click.echo(
+        f"Imported {len(imported)} versions, "
+        f"{len(store.versions)} versions and {len(store.tags)} tags in store."
+    )
+
+
+def echo_status(status: dict[str, str | None]):
+    """Echo validation status of each revalidated standard name."""
+    for name, error in sorted(status.items()):
+        click.echo(f"{name or '<file>'}: {error or 'ok'}")
+
+
+@click.command()
+@click.argument("standardnames_file")
+@click.option("--unit-format", default="~F", help="Pint unit string formatter")
+@click.option("--interval", default=0.5, help="Polling interval in seconds")
+def watch_standardnames(standardnames_file: str, unit_format: str, interval: float):
+    """Revalidate edited entries each time the standard name file is saved."""
+    from imas_standard_names.watch import Watcher
+
+    watcher = Watcher(standardnames_file, unit_format=unit_format)
+    click.echo(
+        f"Watching {len(watcher.names)} standard names in {standardnames_file}, "
+        f"{len(watcher.errors)} invalid."
+    )
+    echo_status(dict(watcher.errors))
+    try:
+        watcher.watch(interval=interval, callback=echo_status)
+    except KeyboardInterrupt:
+        pass
+
+
+@click.command()
+@click.argument("standardnames_file")
+@click.option("--host", default="127.0.0.1", help="Interface to bind")
+@click.option("--port", default=8000, help="Port to listen on")
+@click.option("--unit-format", default="~F", help="Pint unit string formatter")
+@click.option("--interval", default=1.0, help="Reload polling interval in seconds")
+def serve_standardnames(
+    standardnames_file: str, host: str, port: int, unit_format: str, interval: float
+):
+    """Serve the standard name file read-only over HTTP."""
+    from imas_standard_names.server import QueryService
+
+    service = QueryService(standardnames_file, unit_format=unit_format)
+    server = service.server(host, port)
+    threading.Thread(target=service.watch, args=(interval,), daemon=True).start()
+    click.echo(
+        f"Serving {len(service.state.hashes)} standard names "
+        f"on http://{host}:{server.server_port}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+@click.command()
+@click.argument("submission_dir")
+@click.argument("standardnames_file")
+@click.argument("genericnames_file")
+@click.option("--unit-format", default="~F", help="Pint unit string formatter")
+@click.option("--workers", default=None, type=int, help="Number of worker processes")
+@click.option("--output-dir", default=None, help="Write comment bodies to directory")
+@click.option(
+    "--github-repository", default=None, help="Post comments to owner/repository"
+)
+@click.option("--github-api-url", default="https://api.github.com")
+def triage_standardnames(
+    submission_dir: str,
+    standardnames_file: str,
+    genericnames_file: str,
+    unit_format: str,
+    workers: int | None,
+    output_dir: str | None,
+    github_repository: str | None,
+    github_api_url: str,
+):
+    """Validate a directory of issue-form submissions and send comment bodies."""
+    import asyncio
+
+    from imas_standard_names.triage import DirectorySink, GitHubSink, triage
+
+    if github_repository:
+        sink = GitHubSink(
+            github_repository, os.environ.get("GITHUB_TOKEN", ""), github_api_url
+        )
+    else:
+        sink = DirectorySink(output_dir or submission_dir)
+    comments = asyncio.run(
+        triage(
+            submission_dir,
+            standardnames_file,
+            genericnames_file,
+            sink,
+            unit_format=unit_format,
+            max_workers=workers,
+        )
+    )
+    for comment in comments:
+        if comment.sink_error:
+            click.echo(f"{comment.submission_file.name}: {comment.sink_error}")
+    valid = sum(comment.valid for comment in comments)
+    click.echo(f"{valid} valid, {len(comments) - valid} invalid submissions.")
+
+
+@click.command()
+@click.argument("cf_file")
+@click.argument("standardnames_file")
+@click.argument("genericnames_file")
+@click.option(
+    "--overwrite", default=False, is_flag=True, help="Overwrite existing entries"
+)
+@click.option("--aliases/--no-aliases", default=True, help="Import CF aliases")
+def import_cf_standardnames(
+    cf_file: str,
+    standardnames_file: str,
+    genericnames_file: str,
+    overwrite: bool,
+    aliases: bool,
+):
+    """Import the CF standard name table XML into the standard name file."""
+    from imas_standard_names.cf import import_cf
+    from imas_standard_names.standard_name import GenericNames, StandardNameFile
+
+    result = import_cf(
+        cf_file,
+        StandardNameFile(standardnames_file),
+        GenericNames(genericnames_file),
+        overwrite=overwrite,
+        aliases=aliases,
+    )
+    for name, message in sorted((result.collisions | result.skipped).items()):
+        click.echo(f"{name}: {message}")
+    click.echo(
+        f"Imported {len(result)} standard names from CF table {result.version}, "
+        f"{len(result.collisions)} collisions, {len(result.skipped)} skipped."
+    )
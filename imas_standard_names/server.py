@@ -0,0 +1,241 @@
+from dataclasses import dataclass, field, InitVar
+import hashlib
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import threading
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from imas_standard_names.catalogue import CompactCatalogue
+from imas_standard_names import export
+from imas_standard_names.messages import format_error
+from imas_standard_names.standard_name import StandardName, StandardNameFile
+from imas_standard_names.watch import monitor
+
+
+def etag(*parts: str) -> str:
+    """Return strong entity tag derived from content hashes."""
+    return '"' + hashlib.sha256("\0".join(parts).encode()).hexdigest()[:32] + '"'
+
+
+@dataclass
+class CatalogueState:
+    """Immutable view of one loaded standard name file."""
+
+    standardnames: StandardNameFile
+    hashes: dict[str, str] = field(init=False, repr=False)
+    catalogue: CompactCatalogue = field(init=False, repr=False)
+    tags: dict[str, list[str]] = field(init=False, repr=False)
+    etag: str = field(init=False)
+    _bodies: dict[str, bytes] = field(init=False, default_factory=dict, repr=False)
+    _units: dict[str, str] = field(init=False, default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        """Index content hashes and tags."""
+        self.hashes = self.standardnames.hashes()
+        self.catalogue = CompactCatalogue.from_file(self.standardnames)
+        self.tags = {}
+        for entry in self.catalogue.entries():
+            for tag in entry.tags:
+                self.tags.setdefault(tag, []).append(entry.name)
+        self.etag = etag(
+            self.standardnames.unit_format or "",
+            *(f"{name}:{digest}" for name, digest in sorted(self.hashes.items())),
+        )
+
+    def _cached(self, key: str, render) -> bytes:
+        """Return rendered response body, rendering it on first request."""
+        if (body := self._bodies.get(key)) is None:
+            body = self._bodies[key] = render().encode()
+        return body
+
+    def units(self, units: str) -> str:
+        """Return units rendered with the unit format used by single entries."""
+        if (rendered := self._units.get(units)) is None:
+            unit_format = self.standardnames.unit_format
+            rendered = self._units[units] = StandardName.parse_units(
+                f"{units}:{unit_format}" if unit_format else units
+            )
+        return rendered
+
+    def entry(self, standard_name: str) -> tuple[str, bytes]:
+        """Return entity tag and json body for a single standard name."""
+        digest = self.hashes[standard_name]
+        body = self._cached(
+            f"names/{standard_name}",
+            lambda: self.standardnames[standard_name].model_dump_json(),
+        )
+        return etag(self.standardnames.unit_format or "", digest), body
+
+    def tag(self, tag: str) -> tuple[str, bytes]:
+        """Return entity tag and json body listing names carrying a tag."""
+        names = self.tags[tag]
+        body = self._cached(
+            f"tags/{tag}", lambda: json.dumps({"tag": tag, "names": names})
+        )
+        return etag(tag, *(self.hashes[name] for name in names)), body
+
+    def search(
+        self, query: str = "", tag: str = "", limit: int = 100
+    ) -> tuple[str, bytes]:
+        """Return entity tag and json body of names matching a query."""
+        query = query.lower()
+        names = self.tags.get(tag, []) if tag else self.catalogue.names
+        matches = [
+            name
+            for name in names
+            if query in name
+            or query in self.catalogue.documentation(self.catalogue.index(name)).lower()
+        ][:limit]
+        body = json.dumps({"names": matches}).encode()
+        return etag(self.etag, query, tag, str(limit)), body
+
+    def export(self) -> tuple[str, bytes]:
+        """Return entity tag and json body of the full catalogue.
+
+        Units are rendered as for single entries and the entity tag includes
+        the unit format.
+        """
+
+        def render():
+            entries = {}
+            for record in export.records(self.catalogue):
+                name = record.pop("name")
+                entries[name] = record | {"units": self.units(record["units"])}
+            return json.dumps(entries, separators=(",", ":"))
+
+        return self.etag, self._cached("export", render)
+
+
+@dataclass
+class QueryService:
+    """Serve a standard name file read-only, reloading it when it changes."""
+
+    input_: InitVar[str | Path]
+    unit_format: str | None = None
+    filename: Path = field(init=False)
+    state: CatalogueState = field(init=False, repr=False)
+    error: str = field(init=False, default="")
+
+    def __post_init__(self, input_: str | Path):
+        """Load initial catalogue state."""
+        self.filename = Path(input_)
+        self.state = self.load()
+
+    def load(self) -> CatalogueState:
+        """Return a freshly loaded catalogue state."""
+        return CatalogueState(
+            StandardNameFile(self.filename, unit_format=self.unit_format)
+        )
+
+    def reload(self) -> bool:
+        """Swap in a new state, keeping the current one if the file is invalid."""
+        try:
+            state = self.load()
+        except Exception as error:
+            self.error = format_error(error)
+            return False
+        self.error = ""
+        self.state = state  # single reference swap, in-flight requests keep theirs
+        return True
+
+    def watch(self, interval: float = 1.0, stop: threading.Event | None = None):
+        """Block, reloading the catalogue each time the file changes."""
+        file_monitor = monitor(self.filename)
+        try:
+            while stop is None or not stop.is_set():
+                if file_monitor.wait(interval) and self.filename.exists():
+                    self.reload()
+        finally:
+            file_monitor.close()
+
+    def respond(
+        self, target: str, if_none_match: str | None = None
+    ) -> tuple[HTTPStatus, dict[str, str], bytes]:
+        """Return status, headers and body for a GET request target."""
+        state = self.state
+        url = urlsplit(target)
+        path = [unquote(part) for part in url.path.strip("/").split("/")]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            limit = int(query.get("limit", 100))
+            if limit < 0:
+                raise ValueError(f"limit must not be negative, got {limit}")
+        except ValueError as error:
+            return self.error_response(HTTPStatus.BAD_REQUEST, error)
+        try:
+            if len(path) == 2 and path[0] == "names":
+                tag, body = state.entry(path[1])
+            elif len(path) == 2 and path[0] == "tags":
+                tag, body = state.tag(path[1])
+            elif path == ["search"]:
+                tag, body = state.search(
+                    query.get("q", ""), query.get("tag", ""), limit
+                )
+            elif path == ["export"]:
+                tag, body = state.export()
+            else:
+                raise KeyError(url.path)
+        except KeyError as error:
+            body = json.dumps({"error": f"**KeyError**: {error} not found"})
+            return HTTPStatus.NOT_FOUND, {}, body.encode()
+        except Exception as error:  # an invalid entry must not drop the connection
+            return self.error_response(HTTPStatus.INTERNAL_SERVER_ERROR, error)
+        headers = {"ETag": tag, "Cache-Control": "no-cache"}
+        if if_none_match is not None and self.matches(if_none_match, tag):
+            return HTTPStatus.NOT_MODIFIED, headers, b""
+        return HTTPStatus.OK, headers, body
+
+    @staticmethod
+    def error_response(
+        status: HTTPStatus, error: Exception
+    ) -> tuple[HTTPStatus, dict[str, str], bytes]:
+        """Return status, headers and json error body for a failed request."""
+        body = json.dumps({"error": format_error(error)})
+        return status, {}, body.encode()
+
+    @staticmethod
+    def matches(if_none_match: str, tag: str) -> bool:
+        """Check If-None-Match header against an entity tag."""
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or tag in [
+            candidate.removeprefix("W/") for candidate in candidates
+        ]
+
+    def server(self, host: str = "127.0.0.1", port: int = 8000) -> ThreadingHTTPServer:
+        """Return threaded HTTP server bound to host and port."""
+        server = ThreadingHTTPServer((host, port), RequestHandler)
+        server.daemon_threads = True
+        server.service = self
+        return server
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """Answer GET and HEAD requests from the server's QueryService."""
+
+    def _send(self, include_body: bool):
+        """Write response for the request target."""
+        status, headers, body = self.server.service.respond(
+            self.path, self.headers.get("If-None-Match")
+        )
+        self.send_response(status)
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        if include_body and status != HTTPStatus.NOT_MODIFIED:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        """Serve GET request."""
+        self._send(True)
+
+    def do_HEAD(self):
+        """Serve HEAD request."""
+        self._send(False)
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
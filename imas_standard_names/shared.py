@@ -0,0 +1,295 @@
+from array import array
+import hashlib
+import mmap
+from multiprocessing import resource_tracker, shared_memory
+import os
+from pathlib import Path
+import struct
+import sys
+import time
+from typing import ClassVar, Iterator
+import zlib
+
+from imas_standard_names.catalogue import CompactCatalogue, Entry
+from imas_standard_names.layout import file_stamp
+
+MAGIC = b"ISNCAT01"
+HEADER = struct.Struct("<8s8sIIQ32s")  # magic, byteorder, count, slots, stamp, digest
+FIELDS = ("names", "units", "aliases", "tags", "links", "documentation")
+SEPARATOR = "\x1f"  # joins tag and link lists within the string blob
+
+
+def _slots(count: int) -> int:
+    """Return power of two hash table size holding count names at half load."""
+    slots = 8
+    while slots < 2 * count:
+        slots *= 2
+    return slots
+
+
+def build_image(source) -> bytes:
+    """Return immutable catalogue image from a ParseYaml or CompactCatalogue.
+
+    The image holds a header, a fixed-size record of (offset, length) pairs per
+    entry, an open addressing hash table over names and one UTF-8 string blob
+    in which identical strings are stored once.
+    """
+    if not isinstance(source, CompactCatalogue):
+        source = CompactCatalogue.from_file(source)
+    count, slots = len(source), _slots(len(source))
+    blob, strings = bytearray(), {}
+    records = array("I")
+    for index in range(count):
+        for value in [
+            source.names[index],
+            source.units[index],
+            source.aliases[index],
+            SEPARATOR.join(source.tags[index]),
+            SEPARATOR.join(source.links[index]),
+            source.documentation(index),
+        ]:
+            if value not in strings:
+                encoded = value.encode()
+                strings[value] = (len(blob), len(encoded))
+                blob += encoded
+            records.extend(strings[value])
+    table = array("I", bytes(4 * slots))
+    for index, name in enumerate(source.names):
+        slot = zlib.crc32(name.encode()) & (slots - 1)
+        while table[slot]:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = index + 1
+    body = records.tobytes() + table.tobytes() + bytes(blob)
+    header = HEADER.pack(
+        MAGIC,
+        sys.byteorder.encode().ljust(8, b"\0"),
+        count,
+        slots,
+        time.time_ns(),
+        hashlib.sha256(body).digest(),
+    )
+    return header + body
+
+
+def publish(source, filename: str | Path) -> Path:
+    """Atomically write a catalogue image for workers to memory map."""
+    filename = Path(filename)
+    tmpfile = filename.with_name(f".{filename.name}.{os.getpid()}.tmp")
+    with open(tmpfile, "wb") as f:
+        f.write(build_image(source))
+    os.replace(tmpfile, filename)
+    return filename
+
+
+def publish_shared(source, name: str | None = None) -> shared_memory.SharedMemory:
+    """Copy a catalogue image into a new shared memory block.
+
+    The caller owns the returned block and must close and unlink it once
+    workers no longer need the image.
+    """
+    image = build_image(source)
+    block = shared_memory.SharedMemory(name, create=True, size=len(image))
+    block.buf[: len(image)] = image
+    return block
+
+
+def _attach_shared(name: str) -> shared_memory.SharedMemory:
+    """Attach to a shared memory block without tracking it for cleanup."""
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:  # Python < 3.13 registers attached blocks for unlinking
+        block = shared_memory.SharedMemory(name)
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+class _Column:
+    """Sequence view decoding one record field from the string blob on access."""
+
+    __slots__ = ("_catalogue", "_field", "_split")
+
+    def __init__(self, catalogue: "SharedCatalogue", field: int, split: bool):
+        """Bind view to a record field."""
+        self._catalogue = catalogue
+        self._field = field
+        self._split = split
+
+    def __len__(self) -> int:
+        """Return number of entries."""
+        return self._catalogue._count
+
+    def __getitem__(self, index: int):
+        """Return decoded field value of the entry at index."""
+        value = self._catalogue._string(index, self._field)
+        if self._split:
+            return tuple(value.split(SEPARATOR)) if value else ()
+        return value
+
+
+class SharedCatalogue:
+    """Read-only catalogue attached to a published image without copying it.
+
+    Lookups hash the name into the image's table and compare bytes in place,
+    so only the strings that are read get decoded.
+    """
+
+    __slots__ = (
+        "names",
+        "units",
+        "aliases",
+        "tags",
+        "links",
+        "stamp",
+        "_source",
+        "_handle",
+        "_stat",
+        "_buffer",
+        "_records",
+        "_table",
+        "_blob",
+        "_count",
+        "_slots",
+    )
+
+    STRIDE: ClassVar[int] = 2 * len(FIELDS)
+
+    def __init__(self, buffer, source: Path | str | None = None, handle=None):
+        """Validate image header and bind zero-copy views of its sections."""
+        self._source, self._handle, self._stat = source, handle, None
+        self._buffer = memoryview(buffer)
+        magic, byteorder, count, slots, stamp, digest = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or byteorder.rstrip(b"\0").decode() != sys.byteorder:
+            self._buffer.release()
+            raise ValueError("The buffer does not hold a compatible catalogue image.")
+        self._count, self._slots, self.stamp = count, slots, (stamp, digest.hex())
+        start = HEADER.size
+        end = start + 4 * self.STRIDE * count
+        self._records = self._buffer[start:end].cast("I")
+        self._table = self._buffer[end : end + 4 * slots].cast("I")
+        self._blob = self._buffer[end + 4 * slots :]
+        self.names = _Column(self, 0, False)
+        self.units = _Column(self, 1, False)
+        self.aliases = _Column(self, 2, False)
+        self.tags = _Column(self, 3, True)
+        self.links = _Column(self, 4, True)
+
+    @classmethod
+    def attach(cls, filename: str | Path) -> "SharedCatalogue":
+        """Memory map a published image file."""
+        with open(filename, "rb") as f:
+            image = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            stamp = file_stamp(f.fileno())
+        catalogue = cls(image, Path(filename), image)
+        catalogue._stat = stamp
+        return catalogue
+
+    @classmethod
+    def attach_shared(cls, name: str) -> "SharedCatalogue":
+        """Attach to an image published in a shared memory block."""
+        block = _attach_shared(name)
+        return cls(block.buf, name, block)
+
+    def _read_stamp(self) -> tuple[int, str] | None:
+        """Return stamp of the image currently published at the source."""
+        try:
+            if isinstance(self._source, Path):
+                with open(self._source, "rb") as f:
+                    header = f.read(HEADER.size)
+            else:
+                block = _attach_shared(self._source)
+                try:
+                    header = bytes(block.buf[: HEADER.size])
+                finally:
+                    block.close()
+            *_, stamp, digest = HEADER.unpack(header)
+        except (OSError, struct.error):
+            return None
+        return stamp, digest.hex()
+
+    def is_current(self) -> bool:
+        """Check that the attached image is still the published one."""
+        if self._source is None:
+            return True
+        if isinstance(self._source, Path):
+            try:
+                if file_stamp(self._source) == self._stat:
+                    return True
+            except OSError:
+                return False
+        return self._read_stamp() == self.stamp
+
+    def close(self):
+        """Release views of the image and detach from it."""
+        for view in [self._records, self._table, self._blob, self._buffer]:
+            view.release()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self) -> "SharedCatalogue":
+        """Return self as context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Detach from image."""
+        self.close()
+
+    def _span(self, index: int, field: int) -> tuple[int, int]:
+        """Return blob offset and length of a record field."""
+        position = index * self.STRIDE + 2 * field
+        return self._records[position], self._records[position + 1]
+
+    def _string(self, index: int, field: int) -> str:
+        """Return decoded record field."""
+        offset, length = self._span(index, field)
+        return str(self._blob[offset : offset + length], "utf-8")
+
+    def __len__(self) -> int:
+        """Return number of standard names."""
+        return self._count
+
+    def index(self, name: str) -> int:
+        """Return position of name within the catalogue."""
+        encoded = name.encode()
+        mask = self._slots - 1
+        slot = zlib.crc32(encoded) & mask
+        while entry := self._table[slot]:
+            offset, length = self._span(entry - 1, 0)
+            if (
+                length == len(encoded)
+                and self._blob[offset : offset + length] == encoded
+            ):
+                return entry - 1
+            slot = (slot + 1) & mask
+        raise KeyError(name)
+
+    def __contains__(self, name: str) -> bool:
+        """Check if name is included in the catalogue."""
+        try:
+            self.index(name)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over standard names in catalogue order."""
+        return (self.names[index] for index in range(self._count))
+
+    def __getitem__(self, name: str) -> Entry:
+        """Return Entry view for the requested standard name."""
+        return Entry(self, self.index(name))
+
+    def get(self, name: str, default=None) -> Entry | None:
+        """Return Entry view for name if present, else default."""
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def documentation(self, index: int) -> str:
+        """Return documentation for the entry at index."""
+        return self._string(index, 5)
+
+    def entries(self) -> Iterator[Entry]:
+        """Iterate over Entry views in catalogue order."""
+        return (Entry(self, index) for index in range(self._count))
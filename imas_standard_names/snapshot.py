@@ -0,0 +1,191 @@
+from dataclasses import dataclass, field, InitVar
+import json
+import os
+from pathlib import Path
+import subprocess
+from typing import Any, Mapping
+
+import yaml
+
+from imas_standard_names.catalogue import CompactCatalogue, SafeLoader
+from imas_standard_names.standard_name import entry_hash
+
+
+def normalize(value: Any) -> Any:
+    """Return yaml value with scalars cast to strings, matching the yaml schema."""
+    if isinstance(value, Mapping):
+        return {str(key): normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+    return "" if value is None else str(value)
+
+
+@dataclass
+class SnapshotStore:
+    """Content-addressed store of standard name catalogue versions.
+
+    Each normalized entry is written once to objects/ under its entry hash and
+    each catalogue version is a name to hash manifest held in versions/.
+    """
+
+    input_: InitVar[str | Path]
+    path: Path = field(init=False)
+    versions: dict[str, int] = field(init=False, default_factory=dict)
+    tags: dict[str, str] = field(init=False, default_factory=dict)
+    _manifests: dict[str, dict[str, str]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _objects: dict[str, dict] = field(init=False, default_factory=dict, repr=False)
+
+    def __post_init__(self, input_: str | Path):
+        """Create store directories and load the version index."""
+        self.path = Path(input_)
+        for directory in ["objects", "versions"]:
+            (self.path / directory).mkdir(parents=True, exist_ok=True)
+        if self.index_file.exists():
+            with open(self.index_file, "r") as f:
+                index = json.load(f)
+            self.versions = dict(index["versions"])
+            self.tags = index["tags"]
+
+    @property
+    def index_file(self) -> Path:
+        """Return path of the version and tag index."""
+        return self.path / "index.json"
+
+    @staticmethod
+    def _dump(filename: Path, data: Any):
+        """Write compact json atomically."""
+        filename.parent.mkdir(exist_ok=True)
+        with open(filename.with_suffix(".tmp"), "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(filename.with_suffix(".tmp"), filename)
+
+    def _object_file(self, entry: str) -> Path:
+        """Return path of the object holding an entry hash."""
+        return self.path / "objects" / entry[:2] / f"{entry[2:]}.json"
+
+    def save(self):
+        """Write the version and tag index."""
+        self._dump(
+            self.index_file,
+            {"versions": list(self.versions.items()), "tags": self.tags},
+        )
+
+    def add(
+        self, version: str, data: Mapping[str, Mapping], timestamp: int = 0
+    ) -> dict[str, str]:
+        """Store catalogue data as a version, writing only unseen entries."""
+        manifest = {}
+        for name, entry in data.items():
+            entry = normalize(entry)
+            manifest[str(name)] = digest = entry_hash(str(name), entry)
+            if digest not in self._objects:
+                if not (filename := self._object_file(digest)).exists():
+                    self._dump(filename, entry)
+                self._objects[digest] = entry
+        self._dump(self.path / "versions" / f"{version}.json", manifest)
+        self._manifests[version] = manifest
+        self.versions[version] = timestamp
+        return manifest
+
+    def resolve(self, ref: str) -> str:
+        """Return version identifier for a tag, version or unique version prefix."""
+        if ref in self.tags:
+            return self.tags[ref]
+        if ref in self.versions:
+            return ref
+        matches = [version for version in self.versions if version.startswith(ref)]
+        if len(matches) != 1:
+            raise KeyError(f"The reference **{ref}** does not match a single version.")
+        return matches[0]
+
+    def manifest(self, ref: str) -> dict[str, str]:
+        """Return name to entry hash manifest of a version."""
+        version = self.resolve(ref)
+        if version not in self._manifests:
+            with open(self.path / "versions" / f"{version}.json", "r") as f:
+                self._manifests[version] = json.load(f)
+        return self._manifests[version]
+
+    def object(self, entry: str) -> dict:
+        """Return the entry data stored under a hash."""
+        if entry not in self._objects:
+            with open(self._object_file(entry), "r") as f:
+                self._objects[entry] = json.load(f)
+        return self._objects[entry]
+
+    def load(self, ref: str) -> dict[str, dict]:
+        """Return catalogue data as of a version."""
+        return {name: self.object(entry) for name, entry in self.manifest(ref).items()}
+
+    def catalogue(self, ref: str) -> CompactCatalogue:
+        """Return read-only catalogue as of a version."""
+        return CompactCatalogue(self.load(ref).items())
+
+    def entry(self, ref: str, standard_name: str) -> dict:
+        """Return data of a single standard name as of a version."""
+        return self.object(self.manifest(ref)[standard_name])
+
+    def history(self, standard_name: str) -> list[tuple[str, dict | None]]:
+        """Return each version where an entry changed, with its data or None."""
+        changes, previous = [], None
+        for version in self.versions:
+            entry = self.manifest(version).get(standard_name)
+            if entry != previous:
+                changes.append((version, None if entry is None else self.object(entry)))
+                previous = entry
+        return changes
+
+    def import_git(
+        self, repository: str | Path, path: str = "standardnames.yml"
+    ) -> list[str]:
+        """Import every commit touching path in a git repository, oldest first.
+
+        Commits already held by the store are skipped and all file contents are
+        read through a single git cat-file process.
+        """
+        log = self._git(
+            repository, "log", "--reverse", "--format=%H %ct", "--", path
+        ).split()
+        commits = [
+            (commit, int(timestamp))
+            for commit, timestamp in zip(log[::2], log[1::2])
+            if commit not in self.versions
+        ]
+        imported = []
+        with subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repository,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        ) as process:
+            for commit, timestamp in commits:
+                process.stdin.write(f"{commit}:./{path}\n".encode())
+                process.stdin.flush()
+                header = process.stdout.readline().split()
+                if header[-1] == b"missing":  # file deleted in this commit
+                    content = b""
+                else:
+                    content = process.stdout.read(int(header[2]))
+                    process.stdout.read(1)
+                try:
+                    data = yaml.load(content, Loader=SafeLoader) or {}
+                except yaml.YAMLError:
+                    continue
+                self.add(commit, data, timestamp)
+                imported.append(commit)
+            process.stdin.close()
+        for tag in self._git(repository, "tag", "--list").split():
+            commit = self._git(repository, "rev-list", "-1", tag, "--", path).strip()
+            if commit in self.versions:
+                self.tags[tag] = commit
+        self.save()
+        return imported
+
+    @staticmethod
+    def _git(repository: str | Path, *args: str) -> str:
+        """Return output of a git command run in repository."""
+        return subprocess.run(
+            ["git", *args], cwd=repository, check=True, capture_output=True, text=True
+        ).stdout
@@ -0,0 +1,149 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field, InitVar
+import fcntl
+import json
+import os
+from pathlib import Path
+import subprocess
+import time
+import uuid
+
+from imas_standard_names.standard_name import (
+    GenericNames,
+    StandardInput,
+    StandardName,
+    StandardNameFile,
+)
+
+
+@dataclass
+class Drained:
+    """Outcome of draining the submission queue."""
+
+    standard_names: list[StandardName] = field(default_factory=list)
+    issue_links: list[str] = field(default_factory=list)
+    errors: dict[Path, Exception] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Return number of applied submissions."""
+        return len(self.standard_names)
+
+    @property
+    def commit_message(self) -> str:
+        """Return combined commit message listing applied issue links."""
+        names = [standard_name.name for standard_name in self.standard_names]
+        if len(names) == 1:
+            subject = names[0]
+        else:
+            subject = f"Add {len(names)} Standard Names"
+        body = [
+            f"- {name} Closes {link}" if link else f"- {name}"
+            for name, link in zip(names, self.issue_links)
+        ]
+        return "\n".join([f"{subject} :rocket:", ""] + body)
+
+    def commit(self, standardnames_file: str | Path):
+        """Commit the updated standard names file with the combined message."""
+        standardnames_file = Path(standardnames_file)
+        for command in [
+            ["git", "add", standardnames_file.name],
+            ["git", "commit", "-m", self.commit_message],
+        ]:
+            subprocess.run(
+                command, cwd=standardnames_file.parent, check=True, capture_output=True
+            )
+
+
+@dataclass
+class SubmissionQueue:
+    """Spool approved submissions and apply them with a single file update."""
+
+    input_: InitVar[str | Path]
+    path: Path = field(init=False)
+
+    def __post_init__(self, input_: str | Path):
+        """Create spool directory."""
+        self.path = Path(input_)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def failed(self) -> Path:
+        """Return directory holding submissions that failed to apply."""
+        return self.path / "failed"
+
+    @contextmanager
+    def lock(self):
+        """Hold an exclusive lock on the spool directory."""
+        with open(self.path / ".lock", "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def __iter__(self):
+        """Iterate over spooled submission files in arrival order."""
+        return iter(sorted(self.path.glob("*.json")))
+
+    def __len__(self) -> int:
+        """Return number of spooled submissions."""
+        return len(list(self.path.glob("*.json")))
+
+    def put(
+        self, submission_file: str | Path, issue_link: str = "", overwrite: bool = False
+    ) -> Path:
+        """Spool a copy of the submission together with its issue link."""
+        with open(submission_file, "r") as f:
+            data = json.load(f)
+        data |= {"issue_link": issue_link, "overwrite": overwrite}
+        # time prefix keeps arrival order, the random suffix rules out collisions
+        filename = self.path / f"{time.time_ns():020d}-{uuid.uuid4().hex}.json"
+        with self.lock():
+            with open(filename.with_suffix(".tmp"), "w") as f:
+                json.dump(data, f)
+            os.replace(filename.with_suffix(".tmp"), filename)
+        return filename
+
+    def drain(
+        self,
+        standardnames_file: str | Path,
+        genericnames_file: str | Path,
+        unit_format: str = "~F",
+    ) -> Drained:
+        """Apply all spooled submissions with one load and one write."""
+        drained = Drained()
+        with self.lock():
+            submissions = list(self)
+            if not submissions:
+                return drained
+            standardnames = StandardNameFile(
+                standardnames_file, unit_format=unit_format
+            )
+            genericnames = GenericNames(genericnames_file)
+            for submission_file in submissions:
+                with open(submission_file, "r") as f:
+                    data = json.load(f)
+                try:
+                    standard_name = StandardInput(
+                        submission_file,
+                        unit_format=unit_format,
+                        issue_link=data["issue_link"],
+                    ).standard_name
+                    genericnames.check(standard_name.name)
+                    standardnames.update(
+                        standard_name, overwrite=data["overwrite"], update_file=False
+                    )
+                except (NameError, KeyError, Exception) as error:
+                    self.failed.mkdir(exist_ok=True)
+                    failed_file = self.failed / submission_file.name
+                    os.replace(submission_file, failed_file)
+                    drained.errors[failed_file] = error
+                else:
+                    drained.standard_names.append(standard_name)
+                    drained.issue_links.append(data["issue_link"])
+            if drained.standard_names:
+                standardnames.write()
+            for submission_file in submissions:
+                if submission_file.exists():
+                    submission_file.unlink()
+        return drained
@@ -1,16 +1,39 @@
 from dataclasses import dataclass, field, InitVar
 from functools import cached_property
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, Container, Iterable, Mapping
 
 import numpy as np
+import numpy.typing as npt
 import pandas
 import pydantic
 import strictyaml as syaml
 import yaml
 
 from imas_standard_names import pint
+from imas_standard_names import units
+from imas_standard_names.layout import file_stamp, yaml_blocks
+from imas_standard_names.units import expression
+
+
+def entry_hash(standard_name: str, data: Mapping) -> str:
+    """Return content hash of a raw standard name entry."""
+    content = json.dumps({standard_name: data}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def merge_links(*values: str | list[str]) -> list[str]:
+    """Return sorted union of issue links given as strings or lists."""
+    links = [
+        link
+        for value in values
+        for link in ([value] if isinstance(value, str) else value)
+        if link
+    ]
+    return np.unique(links).tolist() if links else []
 
 
 class StandardName(pydantic.BaseModel):
@@ -59,8 +82,8 @@ class StandardName(pydantic.BaseModel):
         if units == "none":
             return units
         if "L" in unit_format:  # LaTeX format
-            return f"$`{pint.Unit(units):{unit_format}}`$"
-        return f"{pint.Unit(units):{unit_format}}"
+            return f"$`{pint.Unit(expression(units)):{unit_format}}`$"
+        return f"{pint.Unit(expression(units)):{unit_format}}"
 
     @pydantic.field_validator("tags", "links", mode="after")
     @classmethod
@@ -70,15 +93,18 @@ class StandardName(pydantic.BaseModel):
             return value
         return [item.strip() for item in value.split(",")]
 
-    def as_document(self) -> syaml.representation.YAML:
-        """Return standard name as a YAML document."""
-        data = {
+    def as_data(self) -> dict:
+        """Return standard name entry as plain data with empty fields dropped."""
+        return {
             key: value
             for key, value in self.items()
             if (key == "units" and value != "none")
             or (key != "units" and value != [] and value != "")
         }
-        return syaml.as_document({self.name: data}, schema=ParseYaml.schema)
+
+    def as_document(self) -> syaml.representation.YAML:
+        """Return standard name as a YAML document."""
+        return syaml.as_document({self.name: self.as_data()}, schema=ParseYaml.schema)
 
     def as_yaml(self) -> str:
         """Return standard name as YAML string."""
@@ -133,6 +159,42 @@ class ParseYaml:
             self._append_unit_format(data)
         return StandardName(name=standard_name, **data)
 
+    def convert(
+        self,
+        standard_name: str,
+        values: npt.ArrayLike,
+        from_units: str,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Return values converted to the units of the requested standard name."""
+        to_units = self.data[standard_name].data.get("units", "none")
+        return units.convert(values, from_units, to_units, out=out)
+
+    def convert_batch(
+        self,
+        values: Mapping[str, npt.ArrayLike],
+        from_units: Mapping[str, str],
+        out: Mapping[str, np.ndarray] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Return mapping of values converted to the units of each standard name."""
+        out = out or {}
+        return {
+            standard_name: self.convert(
+                standard_name,
+                array,
+                from_units[standard_name],
+                out=out.get(standard_name),
+            )
+            for standard_name, array in values.items()
+        }
+
+    def hashes(self) -> dict[str, str]:
+        """Return content hash for each standard name."""
+        return {
+            standard_name: entry_hash(standard_name, data)
+            for standard_name, data in self.data.data.items()
+        }
+
     def as_yaml(self) -> str:
         """Return yaml data as string."""
         yaml_data = ""
@@ -193,13 +255,26 @@ class StandardNameFile(ParseYaml):
     """Manage the project's standard name file."""
 
     input_: InitVar[str | Path]
+    _layout: dict[str, tuple[int, int]] | None = field(
+        init=False, default=None, repr=False
+    )
+    _stamp: tuple[int, int, int] | None = field(init=False, default=None, repr=False)
 
     def __post_init__(self, input_: str | Path):
         """Load standard name data from yaml file."""
         self._filename = Path(input_)
-        with open(self.filename, "r") as f:
-            yaml_data = syaml.load(f.read(), self.schema)
+        with open(self.filename, "rb") as f:
+            content = f.read()
+            stamp = file_stamp(f.fileno())
+        yaml_data = syaml.load(content.decode(), self.schema)
         super().__post_init__(yaml_data.as_yaml())
+        self._sync(content, stamp)
+
+    def _sync(self, content: bytes, stamp: tuple[int, int, int]):
+        """Record byte offset of each top-level block in the file content."""
+        # latin-1 maps bytes one-to-one onto characters, giving byte offsets
+        self._layout = yaml_blocks(content.decode("latin-1"))
+        self._stamp = stamp
 
     @property
     def filename(self) -> Path:
@@ -213,9 +288,13 @@ class StandardNameFile(ParseYaml):
         for key, value in other.data.items():
             # append issue links to existing list
             if key in self.data:
-                links = self.data.data[key].get("links", "") + value.get("links", "")
-                value["links"] = np.unique(links).tolist()
+                links = merge_links(
+                    self.data.data[key].get("links", []), value.get("links", [])
+                )
+                if links:
+                    value["links"] = links
             self.data[key] = value
+        self._layout = None  # in-memory data no longer matches the file layout
         return self
 
     def __iadd__(self, other):
@@ -229,6 +308,65 @@ class StandardNameFile(ParseYaml):
         update_file: bool = True,
     ):
         """Add json data to self and update standard names file."""
+        if update_file:  # refuse before mutating so the instance stays consistent
+            self.check_unchanged()
+        self.check(standard_name, overwrite)
+        layout = self._layout
+        self += standard_name.as_document()
+        if update_file:
+            self.write_entry(standard_name.name, layout)
+
+    def update_batch(
+        self,
+        standard_names: Iterable[StandardName],
+        overwrite: bool = False,
+        update_file: bool = True,
+    ) -> dict[str, Exception]:
+        """Add many standard names with one document rebuild and one file write.
+
+        Aliases may refer to names earlier in the batch. Entries failing the
+        update checks, including repeats of a name unless overwrite is set, are
+        left out and returned with their errors.
+        """
+        if update_file:
+            self.check_unchanged()
+        data = self.data.data
+        errors: dict[str, Exception] = {}
+        for standard_name in standard_names:
+            try:
+                self.check(standard_name, overwrite, names=data)
+                if not overwrite and standard_name.name in data:
+                    raise KeyError(
+                        f"The proposed standard name **{standard_name.name}** "
+                        "appears more than once in the batch."
+                    )
+            except KeyError as error:
+                errors[standard_name.name] = error
+                continue
+            entry = standard_name.as_data()
+            if standard_name.name in data:
+                links = merge_links(
+                    data[standard_name.name].get("links", []), entry.get("links", [])
+                )
+                if links:
+                    entry["links"] = links
+            data[standard_name.name] = entry
+        self.data = syaml.as_document(data, self.schema)
+        self._layout = None
+        if update_file:
+            self.write()
+        return errors
+
+    def check(
+        self,
+        standard_name: StandardName,
+        overwrite: bool = False,
+        names: Container[str] | None = None,
+    ):
+        """Raise KeyError if standard name cannot be added to self.
+
+        Aliases are looked up in names when given, otherwise in self.
+        """
         if not overwrite:  # check for existing standard name
             try:
                 assert standard_name.name not in self.data
@@ -241,16 +379,92 @@ class StandardNameFile(ParseYaml):
                 )
         if standard_name.alias:
             try:
-                assert standard_name.alias in self.data
+                assert standard_name.alias in (self.data if names is None else names)
             except AssertionError:
                 raise KeyError(
                     f":alien: The proposed alias **{standard_name.alias}** "
                     f"is not present in {self.filename}."
                 )
-        self += standard_name.as_document()
-        if update_file:
-            with open(self.filename, "w") as f:
-                f.write(self.data.as_yaml())
+
+    def changed(self) -> bool:
+        """Check if the file changed on disk since it was last read or written."""
+        try:
+            return self._stamp != file_stamp(self.filename)
+        except FileNotFoundError:
+            return True
+
+    def check_unchanged(self):
+        """Raise RuntimeError if the file changed on disk since it was read."""
+        if self.changed():
+            raise RuntimeError(
+                f":warning: The {self.filename} file changed on disk since it was "
+                "read. Reload the file and reapply the update."
+            )
+
+    def write(self):
+        """Write standard name data to file, refusing to clobber external edits."""
+        self.check_unchanged()
+        content = self.data.as_yaml().encode()
+        with open(self.filename, "wb") as f:
+            f.write(content)
+            f.flush()
+            self._sync(content, file_stamp(f.fileno()))
+
+    def write_entry(
+        self, standard_name: str, layout: dict[str, tuple[int, int]] | None
+    ):
+        """Append or splice a single entry in place, else rewrite the whole file.
+
+        New entries are appended with a single write. Existing entries replace
+        the byte range of their block. The whole file is rewritten when the
+        block layout is ambiguous, and nothing is written when the file has
+        changed since it was read.
+        """
+        if layout is None or self.changed():
+            return self.write()
+        content = (
+            syaml.as_document(
+                {standard_name: self.data[standard_name].data}, schema=self.schema
+            )
+            .as_yaml()
+            .encode()
+        )
+        layout = layout.copy()
+        if standard_name in layout:
+            start, end = layout[standard_name]
+            with open(self.filename, "rb+") as f:
+                f.seek(start)
+                tail = f.read()
+                block = tail[: end - start]
+                content += block[len(block.rstrip(b"\n")) + 1 :]  # blank lines
+                f.seek(start)
+                f.write(content + tail[end - start :])
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+                stamp = file_stamp(f.fileno())
+            shift = len(content) - (end - start)
+            layout = {
+                name: (span[0] + shift, span[1] + shift) if span[0] >= end else span
+                for name, span in layout.items()
+            }
+            layout[standard_name] = (start, start + len(content))
+        else:
+            with open(self.filename, "ab+") as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(size - 1, 0))
+                prefix = b"\n" if size and f.read(1) != b"\n" else b""
+                f.write(prefix + content)
+                f.flush()
+                os.fsync(f.fileno())
+                stamp = file_stamp(f.fileno())
+            start = size + len(prefix)
+            layout = {
+                name: (span[0], start) if span[1] == size else span
+                for name, span in layout.items()
+            }
+            layout[standard_name] = (start, start + len(content))
+        self._layout, self._stamp = layout, stamp
 
 
 @dataclass
@@ -0,0 +1,177 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, InitVar
+import json
+from pathlib import Path
+import re
+from typing import Protocol
+import urllib.request
+
+from imas_standard_names.messages import format_error, format_success
+from imas_standard_names.standard_name import (
+    GenericNames,
+    StandardInput,
+    StandardNameFile,
+    merge_links,
+)
+
+# catalogue state loaded once per worker process by load()
+_standardnames: StandardNameFile | None = None
+_genericnames: GenericNames | None = None
+_unit_format: str | None = None
+
+
+@dataclass
+class Comment:
+    """Triage outcome and comment body for a single issue-form submission."""
+
+    submission_file: Path
+    body: str
+    valid: bool
+    issue_link: str = ""
+    sink_error: str = ""
+
+    @property
+    def issue_number(self) -> int | None:
+        """Return issue number parsed from the issue link or submission file name."""
+        for text in [self.issue_link.rstrip("/"), self.submission_file.stem]:
+            if match := re.search(r"(\d+)$", text):
+                return int(match[1])
+        return None
+
+
+def load(standardnames_file: str | Path, genericnames_file: str | Path, unit_format):
+    """Load standard and generic names once into the worker process."""
+    global _standardnames, _genericnames, _unit_format
+    _standardnames = StandardNameFile(standardnames_file, unit_format=unit_format)
+    _genericnames = GenericNames(genericnames_file)
+    _unit_format = unit_format
+
+
+def triage_submission(submission_file: str | Path) -> Comment:
+    """Validate a submission against the loaded catalogue without modifying it."""
+    submission_file = Path(submission_file)
+    with open(submission_file, "r") as f:
+        data = json.load(f)
+    issue_link = data.get("issue_link", "")
+    overwrite = data.get(
+        "overwrite", any("overwrite" in option for option in data.get("options") or [])
+    )
+    try:
+        standard_name = StandardInput(
+            submission_file, unit_format=_unit_format, issue_link=issue_link
+        ).standard_name
+        _genericnames.check(standard_name.name)
+        _standardnames.check(standard_name, overwrite=overwrite)
+    except (NameError, KeyError, Exception) as error:
+        return Comment(
+            submission_file, format_error(error, submission_file), False, issue_link
+        )
+    if standard_name.name in _standardnames.data:
+        links = _standardnames.data.data[standard_name.name].get("links", [])
+        standard_name = standard_name.model_copy(
+            update={"links": merge_links(links, standard_name.links)}
+        )
+    return Comment(submission_file, format_success(standard_name), True, issue_link)
+
+
+class Sink(Protocol):
+    """Destination for rendered triage comments."""
+
+    async def send(self, comment: Comment): ...
+
+
+@dataclass
+class DirectorySink:
+    """Write each comment body to a markdown file named after the submission."""
+
+    input_: InitVar[str | Path]
+    path: Path = field(init=False)
+
+    def __post_init__(self, input_: str | Path):
+        """Create output directory."""
+        self.path = Path(input_)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    async def send(self, comment: Comment):
+        """Write comment body."""
+        with open(self.path / f"{comment.submission_file.stem}.md", "w") as f:
+            f.write(comment.body)
+
+
+@dataclass
+class GitHubSink:
+    """Post each comment body to its issue through the GitHub REST API."""
+
+    repository: str
+    token: str = ""
+    api_url: str = "https://api.github.com"
+    concurrency: int = 4
+    timeout: float = 30
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Limit number of concurrent API requests."""
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    def post(self, comment: Comment):
+        """Create issue comment with a blocking API request."""
+        if comment.issue_number is None:
+            raise ValueError(
+                f"No issue number found for {comment.submission_file.name}."
+            )
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        request = urllib.request.Request(
+            f"{self.api_url.rstrip('/')}/repos/{self.repository}"
+            f"/issues/{comment.issue_number}/comments",
+            data=json.dumps({"body": comment.body}).encode(),
+            headers=headers,
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    async def send(self, comment: Comment):
+        """Create issue comment without blocking the event loop."""
+        async with self._semaphore:
+            await asyncio.to_thread(self.post, comment)
+
+
+async def triage(
+    submission_dir: str | Path,
+    standardnames_file: str | Path,
+    genericnames_file: str | Path,
+    sink: Sink,
+    unit_format: str | None = "~F",
+    max_workers: int | None = None,
+) -> list[Comment]:
+    """Validate every submission in a directory and send the rendered comments.
+
+    Validation runs in a process pool whose workers each load the catalogue
+    once, while comments are sent concurrently as results arrive.
+    """
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers,
+        initializer=load,
+        initargs=(standardnames_file, genericnames_file, unit_format),
+    ) as executor:
+
+        async def handle(submission_file: Path) -> Comment:
+            comment = await loop.run_in_executor(
+                executor, triage_submission, submission_file
+            )
+            try:
+                await sink.send(comment)
+            except Exception as error:
+                comment.sink_error = format_error(error)
+            return comment
+
+        return await asyncio.gather(
+            *(handle(file) for file in sorted(Path(submission_dir).glob("*.json")))
+        )
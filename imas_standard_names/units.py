@@ -0,0 +1,78 @@
+from functools import lru_cache
+import re
+
+import numpy as np
+import numpy.typing as npt
+
+from imas_standard_names import pint
+
+UDUNITS_FACTOR = re.compile(r"(?P<unit>[A-Za-z_]+)(?P<power>-?\d+)?")
+F_SEPARATOR = re.compile(r"(?<=[\w)])\.(?=[A-Za-z_(])")
+
+
+def expression(units: str) -> str:
+    """Return F format units string with factors joined by pint's multiply.
+
+    Pint reads ``m^-2.s`` as a float power, so F separators are replaced.
+    """
+    return F_SEPARATOR.sub("*", units)
+
+
+def canonical_units(units: str) -> str:
+    """Return pint parsable units string stripped of any unit format suffix."""
+    units = units.split(":")[0]
+    if units in ["", "none"]:
+        return "dimensionless"
+    return expression(units)
+
+
+@lru_cache(maxsize=None)
+def from_udunits(units: str) -> str:
+    """Return cached UDUNITS product string, such as ``m s-1``, in the F format.
+
+    Dimensionless units, written ``1`` in the CF standard name table, return none.
+    """
+    factors = []
+    for token in units.split():
+        if token == "1":
+            continue
+        if (match := UDUNITS_FACTOR.fullmatch(token)) is None:
+            raise ValueError(f"The units **{units}** are not a product of unit powers.")
+        factors.append(f"{match['unit']}**{match['power'] or 1}")
+    if not factors:
+        return "none"
+    return f"{pint.Unit('*'.join(factors)):~F}" or "none"
+
+
+@lru_cache(maxsize=None)
+def conversion_factors(source: str, target: str) -> tuple[float, float]:
+    """Return cached scale and offset factors that convert source to target units.
+
+    Factors satisfy target = scale * source + offset, which also covers offset
+    units such as degC.
+    """
+    source, target = canonical_units(source), canonical_units(target)
+    offset = pint.Quantity(0.0, source).to(target).magnitude
+    scale = pint.Quantity(1.0, source).to(target).magnitude - offset
+    return float(scale), float(offset)
+
+
+def convert(
+    values: npt.ArrayLike,
+    source: str,
+    target: str,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Return values converted from source to target units.
+
+    Conversion is applied as a single vectorized multiply-add. The result is
+    written to out when given, otherwise a single output array is allocated.
+    """
+    scale, offset = conversion_factors(source, target)
+    if out is None:
+        out = np.multiply(values, scale)
+    else:
+        np.multiply(values, scale, out=out)
+    if offset != 0:
+        np.add(out, offset, out=out)
+    return out
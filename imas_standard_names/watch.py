@@ -0,0 +1,258 @@
+import ctypes
+import ctypes.util
+from dataclasses import dataclass, field, InitVar
+import os
+from pathlib import Path
+import re
+import select
+import struct
+import time
+from typing import Callable, ClassVar
+
+from imas_standard_names.messages import format_error
+from imas_standard_names.layout import file_stamp, yaml_blocks
+from imas_standard_names.standard_name import ParseYaml, StandardName
+
+REFERENCE = re.compile(r"\(#(?P<name>[a-z][a-z0-9_]*)\)")
+
+
+@dataclass
+class StatMonitor:
+    """Detect file changes by polling os.stat."""
+
+    input_: InitVar[str | Path]
+    filename: Path = field(init=False)
+    _stamp: tuple | None = field(init=False, default=None)
+
+    def __post_init__(self, input_: str | Path):
+        """Record initial file stamp."""
+        self.filename = Path(input_)
+        self._stamp = self.stamp()
+
+    def stamp(self) -> tuple | None:
+        """Return modification stamp of the watched file."""
+        try:
+            return file_stamp(self.filename)
+        except FileNotFoundError:
+            return None
+
+    def wait(self, timeout: float) -> bool:
+        """Return True if the file changed within timeout seconds."""
+        deadline = time.monotonic() + timeout
+        while True:
+            stamp = self.stamp()
+            if stamp != self._stamp:
+                self._stamp = stamp
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(0.05, remaining))
+
+    def close(self):
+        """Release monitor resources."""
+
+
+@dataclass
+class InotifyMonitor(StatMonitor):
+    """Detect file changes with Linux inotify on the parent directory."""
+
+    _fd: int = field(init=False, default=-1)
+
+    IN_MODIFY: ClassVar[int] = 0x002
+    IN_CLOSE_WRITE: ClassVar[int] = 0x008
+    IN_MOVED_TO: ClassVar[int] = 0x080
+    IN_CREATE: ClassVar[int] = 0x100
+    EVENT: ClassVar[struct.Struct] = struct.Struct("iIII")
+
+    def __post_init__(self, input_: str | Path):
+        """Register inotify watch on the directory holding the file."""
+        super().__post_init__(input_)
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        directory = os.fsencode(self.filename.parent.resolve())
+        if libc.inotify_add_watch(self._fd, directory, mask) < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def _events(self) -> set[str]:
+        """Return names of files with pending events."""
+        names = set()
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+        offset = 0
+        while offset < len(buffer):
+            _, _, _, length = self.EVENT.unpack_from(buffer, offset)
+            offset += self.EVENT.size
+            names.add(os.fsdecode(buffer[offset : offset + length].rstrip(b"\0")))
+            offset += length
+        return names
+
+    def wait(self, timeout: float) -> bool:
+        """Return True if the file changed within timeout seconds."""
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            if not select.select([self._fd], [], [], remaining)[0]:
+                return False
+            if self.filename.name in self._events():
+                stamp = self.stamp()
+                if stamp != self._stamp:
+                    self._stamp = stamp
+                    return True
+        return False
+
+    def close(self):
+        """Close inotify file descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def monitor(filename: str | Path) -> StatMonitor:
+    """Return inotify monitor where available, falling back to stat polling."""
+    try:
+        return InotifyMonitor(filename)
+    except (OSError, AttributeError, TypeError):
+        return StatMonitor(filename)
+
+
+@dataclass
+class Watcher:
+    """Keep a parsed catalogue in memory and revalidate only edited blocks."""
+
+    input_: InitVar[str | Path]
+    unit_format: str | None = None
+    filename: Path = field(init=False)
+    entries: dict[str, StandardName] = field(init=False, default_factory=dict)
+    errors: dict[str, str] = field(init=False, default_factory=dict)
+    _blocks: dict[str, int | str] = field(init=False, default_factory=dict, repr=False)
+    _depends: dict[str, frozenset[str]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _dependents: dict[str, set[str]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    def __post_init__(self, input_: str | Path):
+        """Parse and validate the full file."""
+        self.filename = Path(input_)
+        self.refresh()
+
+    @property
+    def names(self) -> set[str]:
+        """Return names of all top-level blocks, valid or not."""
+        return set(self._blocks)
+
+    def _unlink(self, name: str):
+        """Remove entry and its edges from the dependency index."""
+        self.entries.pop(name, None)
+        for target in self._depends.pop(name, ()):
+            self._dependents[target].discard(name)
+            if not self._dependents[target]:
+                del self._dependents[target]
+
+    def _parse(self, name: str, parse: Callable[[], StandardName]):
+        """Parse a single entry and index its alias and documentation links."""
+        self._unlink(name)
+        try:
+            standard_name = parse()
+        except Exception as error:
+            self.errors[name] = format_error(error)
+            return
+        self.errors.pop(name, None)
+        self.entries[name] = standard_name
+        depends = {
+            match["name"] for match in REFERENCE.finditer(standard_name.documentation)
+        }
+        if standard_name.alias:
+            depends.add(standard_name.alias)
+        self._depends[name] = frozenset(depends)
+        for target in depends:
+            self._dependents.setdefault(target, set()).add(name)
+
+    def _check_dependencies(self, name: str):
+        """Validate alias and documentation links against the catalogue."""
+        if name not in self.entries:
+            return
+        alias = self.entries[name].alias
+        missing = sorted(
+            target
+            for target in self._depends[name]
+            if target != alias and target not in self._blocks
+        )
+        if alias and alias not in self._blocks:
+            self.errors[name] = (
+                f"**KeyError**: :alien: The alias **{alias}** "
+                f"is not present in {self.filename}."
+            )
+        elif missing:
+            self.errors[name] = (
+                "**KeyError**: The documentation links to "
+                f"{', '.join(f'**{target}**' for target in missing)} "
+                f"which is not present in {self.filename}."
+            )
+        else:
+            self.errors.pop(name, None)
+
+    def refresh(self) -> dict[str, str | None]:
+        """Re-parse changed blocks and return status of each revalidated name.
+
+        The returned mapping holds an error message, or None once valid, for
+        every changed, removed or dependent entry.
+        """
+        with open(self.filename, "r") as f:
+            text = f.read()
+        spans = yaml_blocks(text)
+        if spans is None:  # ambiguous layout, fall back to a full parse
+            try:
+                parsed = ParseYaml(text, unit_format=self.unit_format)
+            except Exception as error:
+                self.errors[""] = format_error(error)
+                return {"": self.errors[""]}
+            blocks = parsed.hashes()
+            parsers = {name: (lambda name=name: parsed[name]) for name in blocks}
+        else:
+            texts = {name: text[slice(*span)] for name, span in spans.items()}
+            blocks = {name: hash(block) for name, block in texts.items()}
+            parsers = {
+                name: (
+                    lambda name=name: ParseYaml(
+                        texts[name], unit_format=self.unit_format
+                    )[name]
+                )
+                for name in blocks
+            }
+        self.errors.pop("", None)
+        changed = {
+            name for name, block in blocks.items() if self._blocks.get(name) != block
+        }
+        removed = self._blocks.keys() - blocks.keys()
+        for name in removed:
+            self._unlink(name)
+            self.errors.pop(name, None)
+        self._blocks = blocks
+        for name in changed:
+            self._parse(name, parsers[name])
+        revalidate = set(changed)
+        for name in changed | removed:
+            revalidate |= self._dependents.get(name, set())
+        for name in revalidate:
+            self._check_dependencies(name)
+        return {name: self.errors.get(name) for name in revalidate | removed}
+
+    def watch(self, interval: float = 0.5, callback=None, stop=None):
+        """Block, calling callback with refresh results after each change."""
+        file_monitor = monitor(self.filename)
+        try:
+            while stop is None or not stop.is_set():
+                if file_monitor.wait(interval) and self.filename.exists():
+                    result = self.refresh()
+                    if callback is not None:
+                        callback(result)
+        finally:
+            file_monitor.close()
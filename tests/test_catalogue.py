@@ -0,0 +1,106 @@
+import pytest
+import strictyaml as syaml
+
+from imas_standard_names.catalogue import CompactCatalogue, Entry
+from imas_standard_names.standard_name import ParseYaml, StandardNameFile
+
+yaml_data = syaml.as_document(
+    {
+        "radial_distance": {
+            "units": "m",
+            "tags": ["cylindrical", "coordinates"],
+            "documentation": "Distance from the central axis.",
+        },
+        "vertical_distance": {
+            "units": "m",
+            "tags": ["cylindrical", "coordinates"],
+            "documentation": "Vertical distance.",
+        },
+        "minor_radius": {
+            "units": "m",
+            "alias": "radial_distance",
+            "links": "https://github.com/iterorganization/IMAS-Standard-Names/issues/5",
+            "documentation": "Minor radius.",
+        },
+        "safety_factor": {"documentation": "Safety factor."},
+    },
+    schema=ParseYaml.schema,
+)
+
+
+@pytest.fixture(scope="module")
+def filename(tmp_path_factory):
+    filename = tmp_path_factory.mktemp("data") / "standardnames.yml"
+    with open(filename, "w") as f:
+        f.write(yaml_data.as_yaml())
+    return filename
+
+
+@pytest.fixture(scope="module")
+def catalogue(filename):
+    return CompactCatalogue.from_yaml(filename)
+
+
+def test_from_file_equals_from_yaml(filename, catalogue):
+    from_file = CompactCatalogue.from_file(StandardNameFile(filename))
+    assert list(from_file) == list(catalogue)
+    assert list(from_file.entries()) == list(catalogue.entries())
+
+
+def test_len_contains(catalogue):
+    assert len(catalogue) == 4
+    assert "minor_radius" in catalogue
+    assert "major_radius" not in catalogue
+
+
+def test_entry(catalogue):
+    entry = catalogue["minor_radius"]
+    assert isinstance(entry, Entry)
+    assert entry.units == "m"
+    assert entry.alias == "radial_distance"
+    assert entry.documentation == "Minor radius."
+    assert entry.links == (
+        "https://github.com/iterorganization/IMAS-Standard-Names/issues/5",
+    )
+
+
+def test_entry_defaults(catalogue):
+    entry = catalogue["safety_factor"]
+    assert entry.units == "none"
+    assert entry.tags == ()
+    assert entry.alias == ""
+
+
+def test_entry_slots(catalogue):
+    with pytest.raises(AttributeError):
+        catalogue["safety_factor"].extra = 1
+
+
+def test_documentation_buffer(catalogue):
+    assert [entry.documentation for entry in catalogue.entries()] == [
+        value["documentation"] for value in yaml_data.data.values()
+    ]
+
+
+def test_shared_tags(catalogue):
+    assert catalogue["radial_distance"].tags is catalogue["vertical_distance"].tags
+
+
+def test_get(catalogue):
+    assert catalogue.get("major_radius") is None
+    assert catalogue.get("minor_radius").name == "minor_radius"
+
+
+def test_missing(catalogue):
+    with pytest.raises(KeyError):
+        catalogue["major_radius"]
+
+
+def test_as_standard_name(filename, catalogue):
+    standard_names = StandardNameFile(filename)
+    for name in catalogue:
+        assert catalogue[name].as_standard_name() == standard_names[name]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
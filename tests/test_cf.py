@@ -0,0 +1,177 @@
+from pathlib import Path
+import tracemalloc
+
+from click.testing import CliRunner
+import pandas
+import pytest
+import strictyaml as syaml
+
+from imas_standard_names.cf import CFTable, import_cf
+from imas_standard_names.scripts import import_cf_standardnames
+from imas_standard_names.standard_name import (
+    GenericNames,
+    StandardName,
+    StandardNameFile,
+)
+from imas_standard_names.units import from_udunits
+
+cf_file = Path(__file__).parent / "data" / "cf-standard-name-table.xml"
+
+standardnames = syaml.as_document(
+    {
+        "air_temperature": {
+            "units": "K",
+            "documentation": "docs",
+            "links": ["issue/1"],
+        },
+    }
+)
+
+genericnames = pandas.DataFrame(
+    [("m^2", "area"), ("A", "current")], columns=["Unit", "Generic Name"]
+)
+
+
+@pytest.fixture
+def files(tmp_path):
+    standardnames_file = tmp_path / "standardnames.yml"
+    standardnames_file.write_text(standardnames.as_yaml())
+    genericnames_file = tmp_path / "generic_names.csv"
+    genericnames.to_csv(genericnames_file, index=False)
+    return standardnames_file, genericnames_file
+
+
+@pytest.mark.parametrize(
+    "units,expected",
+    [
+        ("m s-1", "m.s^-1"),
+        ("kg m-2 s-1", "kg.m^-2.s^-1"),
+        ("m2", "m^2"),
+        ("K", "K"),
+        ("1", "none"),
+        ("", "none"),
+        ("mol mol-1", "none"),
+    ],
+)
+def test_from_udunits(units, expected):
+    assert from_udunits(units) == expected
+
+
+def test_from_udunits_error():
+    with pytest.raises(ValueError):
+        from_udunits("1e-3")
+
+
+def test_table():
+    table = CFTable(cf_file)
+    entries = dict(table)
+    assert table.version == "84"
+    assert len(entries) == 9
+    assert entries["eastward_wind"]["canonical_units"] == "m s-1"
+    assert entries["eastward_wind"]["description"].startswith('"Eastward"')
+    assert entries["sea_temperature"] == {"entry_id": "sea_water_temperature"}
+
+
+def test_table_streaming(tmp_path):
+    filename = tmp_path / "large.xml"
+    with open(filename, "w") as f:
+        f.write("<standard_name_table>\n")
+        for index in range(20_000):
+            f.write(
+                f'<entry id="name_{index}"><canonical_units>m</canonical_units>'
+                f"<description>{'x' * 200}</description></entry>\n"
+            )
+        f.write("</standard_name_table>\n")
+    tracemalloc.start()
+    count = sum(1 for _ in CFTable(filename))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert count == 20_000
+    assert peak < 2_000_000
+
+
+def test_import(files):
+    standardnames_file, genericnames_file = files
+    result = import_cf(
+        cf_file, StandardNameFile(standardnames_file), GenericNames(genericnames_file)
+    )
+    assert result.version == "84"
+    assert set(result.collisions) == {"air_temperature", "area"}
+    assert "generic name" in result.collisions["area"]
+    assert "already present" in result.collisions["air_temperature"]
+    assert list(result.skipped) == ["longitude"]
+    assert "UndefinedUnitError" in result.skipped["longitude"]
+    assert result.added == [
+        "eastward_wind",
+        "precipitation_flux",
+        "cloud_area_fraction",
+        "sea_water_temperature",
+        "sea_temperature",
+        "wind_speed_eastward",
+    ]
+    reloaded = StandardNameFile(standardnames_file)
+    assert reloaded["air_temperature"].documentation == "docs"
+    assert reloaded["eastward_wind"].units == "m.s^-1"
+    assert reloaded["precipitation_flux"].units == "kg.m^-2.s^-1"
+    assert reloaded["cloud_area_fraction"].units == "none"
+    assert reloaded["sea_temperature"].alias == "sea_water_temperature"
+
+
+def test_import_overwrite(files):
+    standardnames_file, _ = files
+    result = import_cf(
+        cf_file, StandardNameFile(standardnames_file), overwrite=True, aliases=False
+    )
+    assert "air_temperature" in result.added
+    assert "sea_temperature" not in result.added
+    reloaded = StandardNameFile(standardnames_file)
+    assert reloaded["air_temperature"].documentation.startswith("Air temperature")
+    assert reloaded["air_temperature"].links == ["issue/1"]
+
+
+def test_import_dry_run(files):
+    standardnames_file, _ = files
+    standard_names = StandardNameFile(standardnames_file)
+    result = import_cf(cf_file, standard_names, update_file=False)
+    assert "eastward_wind" in standard_names.data
+    assert len(result) == 7
+    assert standardnames_file.read_text() == standardnames.as_yaml()
+
+
+def test_update_batch_alias_error(files):
+    standardnames_file, _ = files
+    standard_names = StandardNameFile(standardnames_file)
+    entries = [
+        standard_names["air_temperature"].model_copy(
+            update={"name": "temperature_of_air", "alias": "surface_temperature"}
+        )
+    ]
+    errors = standard_names.update_batch(entries, update_file=False)
+    assert "is not present" in str(errors["temperature_of_air"])
+    assert "temperature_of_air" not in standard_names.data
+
+
+def test_update_batch_duplicate(files):
+    standardnames_file, _ = files
+    standard_names = StandardNameFile(standardnames_file)
+    first = StandardName(name="x_a", documentation="first")
+    second = StandardName(name="x_a", documentation="second")
+    errors = standard_names.update_batch([first, second], update_file=False)
+    assert "more than once" in str(errors["x_a"])
+    assert standard_names["x_a"].documentation == "first"
+    errors = standard_names.update_batch([second], overwrite=True, update_file=False)
+    assert errors == {}
+    assert standard_names["x_a"].documentation == "second"
+
+
+def test_cli(files):
+    result = CliRunner().invoke(
+        import_cf_standardnames, (str(cf_file),) + tuple(str(file) for file in files)
+    )
+    assert result.exit_code == 0
+    assert "Imported 6 standard names from CF table 84" in result.output
+    assert "longitude: **UndefinedUnitError**" in result.output
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
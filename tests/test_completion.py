@@ -0,0 +1,145 @@
+import itertools
+import os
+import subprocess
+import sys
+import time
+
+from click.shell_completion import ShellComplete
+import pytest
+
+from imas_standard_names.completion import NameIndex
+from imas_standard_names.scripts import (
+    get_standardname,
+    has_standardname,
+    is_genericname,
+)
+
+names = [
+    "radial_magnetic_field",
+    "radial_magnetic_field_due_to_plasma_current",
+    "vertical_magnetic_field",
+    "plasma_current",
+    "radial_distance",
+    "magnetic_axis_radial_position",
+]
+
+
+@pytest.fixture
+def index():
+    return NameIndex(names)
+
+
+@pytest.fixture
+def filename(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", (tmp_path / "cache").as_posix())
+    filename = tmp_path / "standardnames.yml"
+    filename.write_text("".join(f"{name}:\n  documentation: docs\n" for name in names))
+    return filename
+
+
+def test_prefix(index):
+    assert index.complete("radial_m") == [
+        "radial_magnetic_field",
+        "radial_magnetic_field_due_to_plasma_current",
+    ]
+    assert index.complete("toroidal") == []
+    assert len(index.complete("")) == len(names)
+
+
+def test_inner_words(index):
+    assert index.complete("magnetic") == [
+        "magnetic_axis_radial_position",
+        "radial_magnetic_field",
+        "radial_magnetic_field_due_to_plasma_current",
+        "vertical_magnetic_field",
+    ]
+    assert index.complete("plasma_cur") == [
+        "plasma_current",
+        "radial_magnetic_field_due_to_plasma_current",
+    ]
+    assert index.complete("field_due") == [
+        "radial_magnetic_field_due_to_plasma_current"
+    ]
+    assert index.complete("field_") == ["radial_magnetic_field_due_to_plasma_current"]
+
+
+def test_limit(index):
+    assert index.complete("magnetic", limit=2) == [
+        "magnetic_axis_radial_position",
+        "radial_magnetic_field",
+    ]
+
+
+def test_cached_artifact(filename):
+    index = NameIndex.from_file(filename)
+    artifact = NameIndex.artifact(filename)
+    assert artifact.exists()
+    mtime = artifact.stat().st_mtime_ns
+    assert NameIndex.from_file(filename).names == index.names
+    assert artifact.stat().st_mtime_ns == mtime
+    stat = filename.stat()
+    with open(filename, "a") as f:
+        f.write("ion_temperature:\n  documentation: docs\n")
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "ion_temperature" in NameIndex.from_file(filename).names
+
+
+def test_ambiguous_layout(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", (tmp_path / "cache").as_posix())
+    filename = tmp_path / "standardnames.yml"
+    filename.write_text("# comment\nplasma_current:\n  documentation: docs\n")
+    assert NameIndex.from_file(filename).names == ["plasma_current"]
+
+
+def test_speed():
+    words = "radial magnetic field due to plasma current ion electron density".split()
+    index = NameIndex(
+        "_".join(combination)
+        for combination in itertools.islice(itertools.permutations(words, 6), 100_000)
+    )
+    assert len(index) == 100_000
+    queries = ["r", "radial_mag", "current", "field_due", "x"]
+    start = time.perf_counter()
+    for incomplete in queries:
+        index.complete(incomplete)
+    indexed = time.perf_counter() - start
+    start = time.perf_counter()
+    for incomplete in queries:
+        [name for name in index.names if incomplete in name][:50]
+    scanned = time.perf_counter() - start
+    # compared with a linear scan on the same runner to avoid wall-clock bounds
+    assert indexed < scanned / 10
+
+
+@pytest.mark.parametrize("command", [has_standardname, get_standardname])
+def test_shell_complete(filename, command):
+    completion = ShellComplete(command, {}, command.name, "_COMPLETE")
+    items = completion.get_completions([filename.as_posix()], "vertical")
+    assert [item.value for item in items] == ["vertical_magnetic_field"]
+
+
+def test_shell_complete_generic_names(tmp_path):
+    filename = tmp_path / "generic_names.csv"
+    filename.write_text("Unit,Generic Name\nm,distance\nm^2,area\n")
+    completion = ShellComplete(is_genericname, {}, is_genericname.name, "_COMPLETE")
+    items = completion.get_completions([filename.as_posix()], "ar")
+    assert [item.value for item in items] == ["area"]
+
+
+def test_completion_imports(filename, tmp_path):
+    script = (
+        "import os, sys\n"
+        f"os.environ['XDG_CACHE_HOME'] = {(tmp_path / 'cold').as_posix()!r}\n"
+        "import imas_standard_names.scripts\n"
+        "from imas_standard_names.completion import NameIndex\n"
+        f"assert NameIndex.from_file({filename.as_posix()!r}).names\n"
+        "print(sorted({'pandas', 'pydantic', 'strictyaml'} & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
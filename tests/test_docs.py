@@ -0,0 +1,153 @@
+import json
+
+import pytest
+import strictyaml as syaml
+
+from imas_standard_names.docs import DocsGenerator, on_pre_build
+from imas_standard_names.standard_name import ParseYaml
+
+standardnames = {
+    "radial_distance": {"units": "m", "tags": "cylindrical", "documentation": "r"},
+    "vertical_distance": {
+        "units": "m",
+        "tags": ["cylindrical", "cartesian"],
+        "documentation": "z",
+    },
+    "poloidal_flux": {"units": "Wb", "documentation": "psi"},
+    "safety_factor": {"documentation": "q"},
+}
+
+
+def parse(data: dict) -> ParseYaml:
+    """Return parsed standard names."""
+    return ParseYaml(syaml.as_document(data, schema=ParseYaml.schema).as_yaml())
+
+
+@pytest.fixture
+def generator(tmp_path):
+    generator = DocsGenerator(parse(standardnames), tmp_path / "generated")
+    generator.generate()
+    return generator
+
+
+def test_generate(generator):
+    assert sorted(path.stem for path in generator.path.glob("names/*.md")) == sorted(
+        standardnames
+    )
+    assert sorted(path.stem for path in generator.path.glob("tags/*.md")) == [
+        "cartesian",
+        "cylindrical",
+    ]
+    assert (generator.path / "index.md").exists()
+    assert generator.manifest_file.exists()
+
+
+def test_fragment(generator):
+    with open(generator.path / "names" / "vertical_distance.md") as f:
+        fragment = f.read()
+    assert fragment.startswith("# `vertical_distance`")
+    assert "$`\\mathrm{m}`$" in fragment
+    assert "[cartesian](../tags/cartesian.md)" in fragment
+
+
+def test_dimensionless_fragment(generator):
+    with open(generator.path / "names" / "safety_factor.md") as f:
+        assert "- _units_: dimensionless" in f.read()
+
+
+def test_tag_page(generator):
+    with open(generator.path / "tags" / "cylindrical.md") as f:
+        page = f.read()
+    assert "[`radial_distance`](../names/radial_distance.md)" in page
+    assert "[`vertical_distance`](../names/vertical_distance.md)" in page
+
+
+def test_unchanged(generator):
+    changes = DocsGenerator(generator.standardnames, generator.path).generate()
+    assert changes == {"written": [], "removed": []}
+
+
+def test_changed_entry(generator):
+    data = standardnames | {
+        "radial_distance": standardnames["radial_distance"] | {"documentation": "R"}
+    }
+    changes = DocsGenerator(parse(data), generator.path).generate()
+    assert sorted(path.name for path in changes["written"]) == [
+        "cylindrical.md",
+        "radial_distance.md",
+    ]
+
+
+def test_removed_entry(generator):
+    data = {
+        key: value for key, value in standardnames.items() if key != "poloidal_flux"
+    }
+    data["vertical_distance"] = standardnames["vertical_distance"] | {
+        "tags": "cylindrical"
+    }
+    changes = DocsGenerator(parse(data), generator.path).generate()
+    assert sorted(path.name for path in changes["removed"]) == [
+        "cartesian.md",
+        "poloidal_flux.md",
+    ]
+    assert not (generator.path / "names" / "poloidal_flux.md").exists()
+
+
+def test_missing_fragment(generator):
+    (generator.path / "names" / "poloidal_flux.md").unlink()
+    changes = DocsGenerator(generator.standardnames, generator.path).generate()
+    assert [path.name for path in changes["written"]] == ["poloidal_flux.md"]
+
+
+def test_cached_units(generator, monkeypatch):
+    def render_units(units):
+        raise AssertionError("units rendered twice")
+
+    monkeypatch.setattr(DocsGenerator, "render_units", render_units)
+    data = standardnames | {
+        "poloidal_flux": standardnames["poloidal_flux"] | {"documentation": "flux"}
+    }
+    DocsGenerator(parse(data), generator.path).generate()
+    with open(generator.manifest_file) as f:
+        manifest = json.load(f)
+    assert manifest["names"]["poloidal_flux"]["units"] == "Wb"
+    assert manifest["units"]["Wb"]["~F"] == "Wb"
+
+
+def test_units_rendered_once(tmp_path, monkeypatch):
+    rendered = []
+    render_units = DocsGenerator.render_units
+
+    def counted(units):
+        rendered.append(units)
+        return render_units(units)
+
+    monkeypatch.setattr(DocsGenerator, "render_units", staticmethod(counted))
+    DocsGenerator(parse(standardnames), tmp_path / "generated").generate()
+    assert sorted(rendered) == ["Wb", "m", "none"]
+
+
+def test_index(generator):
+    with open(generator.path / "index.md") as f:
+        page = f.read()
+    assert "[`cylindrical`](tags/cylindrical.md)" in page
+    assert "[`safety_factor`](names/safety_factor.md): dimensionless" in page
+    data = standardnames | {"poloidal_flux": {"units": "T", "documentation": "B"}}
+    changes = DocsGenerator(parse(data), generator.path).generate()
+    assert generator.path / "index.md" in changes["written"]
+
+
+def test_mkdocs_hook(tmp_path):
+    (tmp_path / "standardnames.yml").write_text(
+        syaml.as_document(standardnames, schema=ParseYaml.schema).as_yaml()
+    )
+    config = {
+        "config_file_path": str(tmp_path / "mkdocs.yml"),
+        "docs_dir": str(tmp_path / "docs"),
+    }
+    on_pre_build(config)
+    assert (tmp_path / "docs" / "generated" / "names" / "safety_factor.md").exists()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
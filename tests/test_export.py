@@ -0,0 +1,118 @@
+import io
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+import strictyaml as syaml
+
+import imas_standard_names
+from imas_standard_names import export
+from imas_standard_names.catalogue import CompactCatalogue
+from imas_standard_names.standard_name import ParseYaml
+
+yaml_data = syaml.as_document(
+    {
+        "radial_distance": {
+            "units": "m",
+            "tags": ["cylindrical", "coordinates"],
+            "documentation": "Distance from the central axis.\n\n$R$ in m.",
+        },
+        "minor_radius": {
+            "units": "m",
+            "alias": "radial_distance",
+            "links": "https://github.com/iterorganization/IMAS-Standard-Names/issues/5",
+            "documentation": "Minor radius. Unicode: ψ",
+        },
+        "safety_factor": {"documentation": "Safety factor."},
+    },
+    schema=ParseYaml.schema,
+)
+
+
+@pytest.fixture(scope="module")
+def standard_names():
+    return ParseYaml(yaml_data.as_yaml())
+
+
+@pytest.fixture(scope="module")
+def catalogue(standard_names):
+    return CompactCatalogue.from_file(standard_names)
+
+
+def test_records(standard_names):
+    records = list(export.records(standard_names))
+    assert [record["name"] for record in records] == list(yaml_data.data)
+    assert records[1]["alias"] == "radial_distance"
+    assert records[2]["units"] == "none"
+
+
+@pytest.mark.parametrize(
+    "exporter,loader,buffer",
+    [
+        (export.dump_jsonl, export.load_jsonl, io.StringIO),
+        (export.dump_json, export.load_json, io.StringIO),
+        (export.dump_msgpack, export.load_msgpack, io.BytesIO),
+    ],
+)
+def test_roundtrip(standard_names, catalogue, exporter, loader, buffer):
+    if exporter is export.dump_msgpack:
+        pytest.importorskip("msgpack")
+    fp = buffer()
+    exporter(standard_names, fp)
+    fp.seek(0)
+    loaded = loader(fp)
+    assert list(loaded) == list(catalogue)
+    assert list(loaded.entries()) == list(catalogue.entries())
+
+
+def test_jsonl_lines(catalogue):
+    fp = io.StringIO()
+    export.dump_jsonl(catalogue, fp)
+    assert len(fp.getvalue().splitlines()) == 3
+
+
+def test_loaded_standard_name(standard_names, catalogue):
+    fp = io.StringIO()
+    export.dump_jsonl(catalogue, fp)
+    fp.seek(0)
+    loaded = export.load_jsonl(fp)
+    for name in loaded:
+        assert loaded[name].as_standard_name() == standard_names[name]
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".json", ".msgpack"])
+def test_dump_load(tmp_path, catalogue, suffix):
+    if suffix == ".msgpack":
+        pytest.importorskip("msgpack")
+    filename = tmp_path / f"standardnames{suffix}"
+    export.dump(catalogue, filename)
+    assert list(export.load(filename).entries()) == list(catalogue.entries())
+
+
+def test_unsupported_format(tmp_path, catalogue):
+    with pytest.raises(ValueError):
+        export.dump(catalogue, tmp_path / "standardnames.csv")
+
+
+def test_loader_imports(tmp_path, catalogue):
+    filename = tmp_path / "standardnames.jsonl"
+    export.dump(catalogue, filename)
+    script = (
+        "import sys\n"
+        "from imas_standard_names import export\n"
+        f"assert len(export.load({filename.as_posix()!r})) == 3\n"
+        "print(sorted({'pydantic', 'strictyaml'} & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(imas_standard_names.__file__).parents[1],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
@@ -0,0 +1,52 @@
+import pytest
+
+from imas_standard_names.layout import file_stamp, yaml_blocks
+
+standardnames = """\
+radial_distance:
+  units: m
+  documentation: Distance from the central axis.
+vertical_distance:
+  units: m
+  documentation: |
+    Vertical distance. See [`radial_distance`](#radial_distance).
+minor_radius:
+  units: m
+  alias: radial_distance
+  documentation: Minor radius.
+"""
+
+
+def test_yaml_blocks():
+    blocks = yaml_blocks(standardnames)
+    assert list(blocks) == ["radial_distance", "vertical_distance", "minor_radius"]
+    assert standardnames[slice(*blocks["minor_radius"])].startswith("minor_radius:")
+    assert blocks["minor_radius"][1] == len(standardnames)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "# comment\nplasma_current:\n  documentation: docs\n",
+        "---\nplasma_current:\n  documentation: docs\n",
+        "a:\n  documentation: docs\na:\n  documentation: docs\n",
+        "{a: {documentation: docs}}\n",
+    ],
+)
+def test_yaml_blocks_ambiguous(text):
+    assert yaml_blocks(text) is None
+
+
+def test_file_stamp(tmp_path):
+    filename = tmp_path / "standardnames.yml"
+    filename.write_text(standardnames)
+    stamp = file_stamp(filename)
+    with open(filename, "rb") as f:
+        assert file_stamp(f.fileno()) == stamp
+    assert file_stamp(str(filename)) == stamp
+    filename.write_text(standardnames + "\n")
+    assert file_stamp(filename) != stamp
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
@@ -0,0 +1,141 @@
+import pytest
+
+from imas_standard_names.mapping import normalize, PathIndex
+
+dd_xml = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<IDSs>
+  <version>4.0.0</version>
+  <IDS name="equilibrium">
+    <field name="time_slice" path="time_slice" path_doc="time_slice(itime)">
+      <field name="profiles_1d" path="time_slice/profiles_1d">
+        <field name="psi" path="time_slice/profiles_1d/psi"
+               standard_name="poloidal_magnetic_flux"/>
+        <field name="q" path="time_slice/profiles_1d/q"/>
+      </field>
+      <field name="global_quantities" path="time_slice/global_quantities">
+        <field name="ip" path="time_slice/global_quantities/ip"/>
+      </field>
+    </field>
+  </IDS>
+  <IDS name="core_profiles">
+    <field name="global_quantities" path="global_quantities">
+      <field name="ip" path="global_quantities/ip"/>
+    </field>
+  </IDS>
+</IDSs>
+"""
+
+
+@pytest.fixture
+def index():
+    return PathIndex(
+        {
+            "equilibrium/time_slice/profiles_1d/psi": "poloidal_magnetic_flux",
+            "equilibrium/time_slice/profiles_1d/q": "safety_factor",
+            "equilibrium/time_slice/global_quantities/ip": "plasma_current",
+            "core_profiles/global_quantities/ip": "plasma_current",
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "equilibrium/time_slice/profiles_1d/psi",
+        "equilibrium/time_slice(itime)/profiles_1d/psi",
+        "equilibrium.time_slice[0].profiles_1d.psi",
+        "/equilibrium/time_slice/3/profiles_1d/psi",
+    ],
+)
+def test_normalize(path):
+    assert normalize(path) == "equilibrium/time_slice/profiles_1d/psi"
+
+
+def test_lookup(index):
+    assert index["equilibrium/time_slice/profiles_1d/psi"] == "poloidal_magnetic_flux"
+    assert index["equilibrium.time_slice[2].profiles_1d.q"] == "safety_factor"
+    assert "equilibrium/time_slice/profiles_1d" not in index
+    assert index.get("equilibrium/time_slice/profiles_1d") is None
+    with pytest.raises(KeyError):
+        index["equilibrium/time_slice"]
+
+
+def test_paths_of(index):
+    assert index.paths_of("plasma_current") == [
+        "equilibrium/time_slice/global_quantities/ip",
+        "core_profiles/global_quantities/ip",
+    ]
+    assert index.paths_of("ion_temperature") == []
+
+
+def test_under(index):
+    assert list(index.under("equilibrium/time_slice(itime)/profiles_1d")) == [
+        ("equilibrium/time_slice/profiles_1d/psi", "poloidal_magnetic_flux"),
+        ("equilibrium/time_slice/profiles_1d/q", "safety_factor"),
+    ]
+    assert len(list(index.under())) == len(index)
+    assert list(index.under("magnetics")) == []
+
+
+def test_annotate(index):
+    assert dict(
+        index.annotate(
+            [
+                "equilibrium/time_slice[0]/profiles_1d/psi",
+                "equilibrium/time_slice[0]/profiles_1d/phi",
+            ]
+        )
+    ) == {
+        "equilibrium/time_slice[0]/profiles_1d/psi": "poloidal_magnetic_flux",
+        "equilibrium/time_slice[0]/profiles_1d/phi": None,
+    }
+
+
+def test_conflict(index):
+    index.add("equilibrium/time_slice/profiles_1d/q", "safety_factor")
+    with pytest.raises(KeyError, match="already mapped"):
+        index.add("equilibrium/time_slice/profiles_1d/q", "plasma_current")
+
+
+def test_missing(index):
+    assert index.missing(["plasma_current", "safety_factor"]) == [
+        "poloidal_magnetic_flux"
+    ]
+
+
+def test_csv_roundtrip(index, tmp_path):
+    filename = tmp_path / "mapping.csv"
+    index.to_csv(filename)
+    assert filename.read_text().splitlines()[0] == "Path,Standard Name"
+    assert PathIndex.from_csv(filename).paths == index.paths
+
+
+def test_from_dd_xml(tmp_path):
+    filename = tmp_path / "IDSDef.xml"
+    filename.write_text(dd_xml)
+    index = PathIndex.from_dd_xml(
+        filename,
+        {
+            "equilibrium/time_slice(itime)/global_quantities/ip": "plasma_current",
+            "core_profiles/global_quantities/ip": "plasma_current",
+        },
+    )
+    assert index.paths == {
+        "equilibrium/time_slice/profiles_1d/psi": "poloidal_magnetic_flux",
+        "equilibrium/time_slice/global_quantities/ip": "plasma_current",
+        "core_profiles/global_quantities/ip": "plasma_current",
+    }
+
+
+def test_from_dd_xml_unknown_path(tmp_path):
+    filename = tmp_path / "IDSDef.xml"
+    filename.write_text(dd_xml)
+    with pytest.raises(KeyError, match="equilibrium/vacuum_toroidal_field/b0"):
+        PathIndex.from_dd_xml(
+            filename, {"equilibrium/vacuum_toroidal_field/b0": "toroidal_field"}
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
@@ -0,0 +1,92 @@
+import pytest
+
+from imas_standard_names.overlay import OverlayCatalogue
+from imas_standard_names.standard_name import StandardNameFile
+
+community = """\
+plasma_current:
+  units: A
+  documentation: Toroidal plasma current.
+  links:
+  - issue/1
+electron_temperature:
+  units: eV
+  documentation: Electron temperature.
+"""
+
+site = """\
+plasma_current:
+  units: MA
+  documentation: Site plasma current.
+  links:
+  - issue/2
+  - issue/1
+coil_current:
+  units: A
+  documentation: Coil current.
+"""
+
+
+@pytest.fixture
+def files(tmp_path):
+    filenames = []
+    for name, text in [("site", site), ("community", community)]:
+        filename = tmp_path / f"{name}.yml"
+        filename.write_text(text)
+        filenames.append(filename)
+    return filenames
+
+
+@pytest.fixture
+def overlay(files):
+    return OverlayCatalogue(files)
+
+
+def test_membership(overlay):
+    assert len(overlay) == 3
+    assert "electron_temperature" in overlay
+    assert "ion_temperature" not in overlay
+    assert list(overlay) == ["plasma_current", "coil_current", "electron_temperature"]
+
+
+def test_priority(overlay):
+    assert overlay["plasma_current"].units == "MA"
+    assert overlay["plasma_current"].documentation == "Site plasma current."
+    assert overlay["electron_temperature"].units == "eV"
+    assert overlay.layer("electron_temperature") is overlay.layers[1]
+
+
+def test_links_union(overlay):
+    assert overlay.links("plasma_current") == ["issue/2", "issue/1"]
+    assert overlay["plasma_current"].links == ["issue/2", "issue/1"]
+    assert overlay.links("coil_current") == []
+
+
+def test_get(overlay):
+    assert overlay.get("coil_current").units == "A"
+    assert overlay.get("ion_temperature") is None
+    with pytest.raises(KeyError):
+        overlay["ion_temperature"]
+
+
+def test_shadowed(overlay):
+    assert overlay.shadowed() == {"plasma_current": [0, 1]}
+
+
+def test_layers_unchanged(files, overlay):
+    overlay["plasma_current"]
+    assert StandardNameFile(files[1])["plasma_current"].links == ["issue/1"]
+    assert files[1].read_text() == community
+
+
+def test_reindex(files):
+    layer = StandardNameFile(files[1])
+    overlay = OverlayCatalogue([files[0], layer])
+    layer.data["ion_temperature"] = {"documentation": "docs", "units": "eV"}
+    assert "ion_temperature" not in overlay
+    overlay.reindex()
+    assert overlay["ion_temperature"].units == "eV"
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
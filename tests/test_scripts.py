@@ -258,5 +258,83 @@ def test_get_standardname_error(tmp_path):
     assert "KeyError" in result.output
 
 
+def test_has_standardname_batch(tmp_path):
+    with (
+        click_runner(tmp_path) as (runner, temp_dir),
+        write_standardnames(standardnames, temp_dir) as standardnames_file,
+    ):
+        result = runner.invoke(
+            has_standardname,
+            (standardnames_file, "--batch", "-"),
+            input="plasma_current\n\nPlasma Current\n",
+        )
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {"name": "plasma_current", "result": True},
+        {"name": "Plasma Current", "result": False},
+    ]
+
+
+def test_is_genericname_batch_jsonl(tmp_path):
+    with (
+        click_runner(tmp_path) as (runner, temp_dir),
+        write_genericnames(genericnames, temp_dir) as genericnames_file,
+    ):
+        batch_file = Path(temp_dir) / "names.jsonl"
+        with open(batch_file, "w") as f:
+            f.write('{"name": "current"}\n"energy"\n{"name": "plasma_current"}\n')
+        result = runner.invoke(
+            is_genericname, (genericnames_file, "--batch", batch_file.as_posix())
+        )
+    assert result.exit_code == 0
+    assert [json.loads(line)["result"] for line in result.output.splitlines()] == [
+        True,
+        True,
+        False,
+    ]
+
+
+def test_get_standardname_batch(tmp_path):
+    with (
+        click_runner(tmp_path) as (runner, temp_dir),
+        write_standardnames(standardnames, temp_dir) as standardnames_file,
+    ):
+        result = runner.invoke(
+            get_standardname,
+            (standardnames_file, "--batch", "-"),
+            input="plasma_current_density\nplasma current\n",
+        )
+    assert result.exit_code == 0
+    found, missing = [json.loads(line) for line in result.output.splitlines()]
+    assert found["result"]["units"] == "A.m^-2"
+    assert found["result"]["documentation"] == "docs"
+    assert missing["name"] == "plasma current"
+    assert "KeyError" in missing["error"]
+
+
+def test_has_standardname_batch_malformed(tmp_path):
+    with (
+        click_runner(tmp_path) as (runner, temp_dir),
+        write_standardnames(standardnames, temp_dir) as standardnames_file,
+    ):
+        result = runner.invoke(
+            has_standardname,
+            (standardnames_file, "--batch", "-"),
+            input='{bad\n{"units": "m"}\n{"name": 1}\nplasma_current\n',
+        )
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert [record["name"] for record in records] == [
+        "{bad",
+        '{"units": "m"}',
+        '{"name": 1}',
+        "plasma_current",
+    ]
+    assert "JSONDecodeError" in records[0]["error"]
+    assert "KeyError" in records[1]["error"]
+    assert "TypeError" in records[2]["error"]
+    assert records[3] == {"name": "plasma_current", "result": True}
+
+
 if __name__ == "__main__":  # pragma: no cover
     pytest.main([__file__])
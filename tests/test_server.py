@@ -0,0 +1,218 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from imas_standard_names.server import QueryService
+
+standardnames = """\
+plasma_current:
+  units: A
+  documentation: Toroidal plasma current.
+  tags:
+  - equilibrium
+electron_temperature:
+  units: eV
+  documentation: Electron temperature.
+  tags:
+  - core_profiles
+poloidal_flux:
+  units: Wb
+  documentation: Poloidal magnetic flux.
+  tags:
+  - equilibrium
+"""
+
+
+@pytest.fixture
+def filename(tmp_path):
+    filename = tmp_path / "standardnames.yml"
+    filename.write_text(standardnames)
+    return filename
+
+
+@pytest.fixture
+def service(filename):
+    return QueryService(filename, unit_format="~F")
+
+
+def write(filename, text):
+    """Write text to file, bumping mtime so stat polling sees the change."""
+    stat = filename.stat()
+    filename.write_text(text)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_name(service):
+    status, headers, body = service.respond("/names/plasma_current")
+    assert status == HTTPStatus.OK
+    assert json.loads(body)["units"] == "A"
+    assert headers["ETag"].startswith('"')
+
+
+def test_not_found(service):
+    status, _, body = service.respond("/names/ion_temperature")
+    assert status == HTTPStatus.NOT_FOUND
+    assert "KeyError" in json.loads(body)["error"]
+    assert service.respond("/unknown")[0] == HTTPStatus.NOT_FOUND
+
+
+def test_not_modified(service):
+    _, headers, _ = service.respond("/names/plasma_current")
+    status, _, body = service.respond("/names/plasma_current", headers["ETag"])
+    assert status == HTTPStatus.NOT_MODIFIED
+    assert body == b""
+    assert service.respond("/names/plasma_current", "*")[0] == HTTPStatus.NOT_MODIFIED
+    assert service.respond("/names/plasma_current", '"other"')[0] == HTTPStatus.OK
+
+
+def test_tags(service):
+    status, _, body = service.respond("/tags/equilibrium")
+    assert status == HTTPStatus.OK
+    assert json.loads(body)["names"] == ["plasma_current", "poloidal_flux"]
+
+
+def test_search(service):
+    assert json.loads(service.respond("/search?q=magnetic")[2]) == {
+        "names": ["poloidal_flux"]
+    }
+    assert json.loads(service.respond("/search?q=current&tag=equilibrium")[2]) == {
+        "names": ["plasma_current"]
+    }
+    assert json.loads(service.respond("/search?limit=1")[2]) == {
+        "names": ["plasma_current"]
+    }
+    assert service.respond("/search?limit=many")[0] == HTTPStatus.BAD_REQUEST
+    assert service.respond("/search?limit=-1")[0] == HTTPStatus.BAD_REQUEST
+
+
+def test_export(service):
+    status, headers, body = service.respond("/export")
+    assert status == HTTPStatus.OK
+    assert set(json.loads(body)) == {
+        "plasma_current",
+        "electron_temperature",
+        "poloidal_flux",
+    }
+    assert headers["ETag"] == service.state.etag
+
+
+@pytest.mark.parametrize("unit_format", ["~F", "~L"])
+def test_export_units(filename, unit_format):
+    service = QueryService(filename, unit_format=unit_format)
+    entry = json.loads(service.respond("/names/poloidal_flux")[2])
+    catalogue = json.loads(service.respond("/export")[2])
+    assert catalogue["poloidal_flux"]["units"] == entry["units"]
+    assert (
+        service.respond("/export")[1]["ETag"]
+        != (QueryService(filename, unit_format="~P").respond("/export")[1]["ETag"])
+    )
+
+
+def test_reload(service, filename):
+    _, entry, _ = service.respond("/names/plasma_current")
+    _, other, _ = service.respond("/names/poloidal_flux")
+    _, catalogue, _ = service.respond("/export")
+    write(filename, standardnames.replace("units: A", "units: MA"))
+    assert service.reload()
+    assert service.respond("/names/plasma_current", entry["ETag"])[0] == HTTPStatus.OK
+    assert (
+        service.respond("/names/poloidal_flux", other["ETag"])[0]
+        == HTTPStatus.NOT_MODIFIED
+    )
+    assert service.respond("/export", catalogue["ETag"])[0] == HTTPStatus.OK
+
+
+def test_reload_invalid(service, filename):
+    state = service.state
+    write(filename, standardnames + "  - [unbalanced\n")
+    assert not service.reload()
+    assert service.error
+    assert service.state is state
+
+
+def test_error_after_reload(service, filename):
+    write(filename, standardnames.replace("units: Wb", "units: mm_"))
+    assert service.reload()
+    assert service.error == ""
+    assert service.respond("/search?limit=-1")[0] == HTTPStatus.BAD_REQUEST
+    status = service.respond("/names/poloidal_flux")[0]
+    assert status == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def test_invalid_entry(filename):
+    write(filename, standardnames.replace("units: Wb", "units: mm_"))
+    service = QueryService(filename, unit_format="~F")
+    status, _, body = service.respond("/names/poloidal_flux")
+    assert status == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert "UndefinedUnitError" in json.loads(body)["error"]
+    server = service.server(port=0)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(
+                f"http://127.0.0.1:{server.server_port}/names/poloidal_flux"
+            )
+        assert error.value.code == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert "UndefinedUnitError" in json.loads(error.value.read())["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_http(service, filename):
+    server = service.server(port=0)
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}),
+        threading.Thread(target=service.watch, args=(0.05, stop)),
+    ]
+    for thread in threads:
+        thread.start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: urllib.request.urlopen(f"{url}/names/poloidal_flux"),
+                    range(16),
+                )
+            )
+        assert {response.headers["ETag"] for response in responses} == {
+            service.respond("/names/poloidal_flux")[1]["ETag"]
+        }
+        for response in responses:
+            response.close()
+        request = urllib.request.Request(
+            f"{url}/names/poloidal_flux",
+            headers={"If-None-Match": responses[0].headers["ETag"]},
+        )
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request)
+        assert error.value.code == HTTPStatus.NOT_MODIFIED
+        state = service.state
+        stop.wait(0.2)  # let the watch thread record the initial file stamp
+        write(filename, standardnames.replace("units: Wb", "units: mWb"))
+        for _ in range(100):
+            if service.state is not state:
+                break
+            stop.wait(0.05)
+        with urllib.request.urlopen(request) as response:
+            assert json.load(response)["units"] == "mWb"
+    finally:
+        stop.set()
+        server.shutdown()
+        server.server_close()
+        for thread in threads:
+            thread.join()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
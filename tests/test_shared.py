@@ -0,0 +1,134 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+import os
+import sys
+
+from click.testing import CliRunner
+import pytest
+import strictyaml as syaml
+
+from imas_standard_names.catalogue import CompactCatalogue
+from imas_standard_names.scripts import publish_standardnames
+from imas_standard_names.shared import (
+    build_image,
+    publish,
+    publish_shared,
+    SharedCatalogue,
+)
+from imas_standard_names.standard_name import ParseYaml
+
+yaml_data = syaml.as_document(
+    {
+        "radial_distance": {
+            "units": "m",
+            "tags": ["cylindrical", "coordinates"],
+            "documentation": "Distance from the central axis.",
+        },
+        "vertical_distance": {
+            "units": "m",
+            "tags": ["cylindrical", "coordinates"],
+            "documentation": "Vertical distance.",
+        },
+        "minor_radius": {
+            "units": "m",
+            "alias": "radial_distance",
+            "links": "https://github.com/iterorganization/IMAS-Standard-Names/issues/5",
+            "documentation": "Minor radius ρ.",
+        },
+        "safety_factor": {"documentation": "Safety factor."},
+    },
+    schema=ParseYaml.schema,
+)
+
+
+@pytest.fixture
+def catalogue(tmp_path):
+    filename = tmp_path / "standardnames.yml"
+    filename.write_text(yaml_data.as_yaml())
+    return CompactCatalogue.from_yaml(filename)
+
+
+@pytest.fixture
+def image(tmp_path, catalogue):
+    return publish(catalogue, tmp_path / "catalogue.img")
+
+
+def lookup(name: str, source: str) -> tuple:
+    with SharedCatalogue.attach_shared(source) as shared:
+        return os.getpid(), shared[name].as_dict()
+
+
+def test_lookup(catalogue, image):
+    with SharedCatalogue.attach(image) as shared:
+        assert len(shared) == 4
+        assert list(shared) == list(catalogue)
+        for name in catalogue:
+            assert shared[name].as_dict() == catalogue[name].as_dict()
+        assert shared["minor_radius"].documentation == "Minor radius ρ."
+        assert shared["radial_distance"].tags == ("cylindrical", "coordinates")
+        assert shared["safety_factor"].tags == ()
+        assert "radial" not in shared
+        assert shared.get("radial") is None
+        with pytest.raises(KeyError):
+            shared["radial"]
+
+
+def test_deduplicated_strings(catalogue):
+    image = build_image(catalogue)
+    assert image.count(b"cylindrical") == 1
+    assert image.count(b"Vertical distance.") == 1
+
+
+def test_incompatible_buffer():
+    with pytest.raises(ValueError):
+        SharedCatalogue(bytes(256))
+
+
+def test_republish(catalogue, image):
+    shared = SharedCatalogue.attach(image)
+    assert shared.is_current()
+    publish(catalogue, image)
+    assert not shared.is_current()
+    assert shared["safety_factor"].documentation == "Safety factor."
+    shared.close()
+    with SharedCatalogue.attach(image) as shared:
+        assert shared.is_current()
+    os.remove(image)
+    assert not shared.is_current()
+
+
+def test_shared_memory(catalogue):
+    block = publish_shared(catalogue)
+    try:
+        with ProcessPoolExecutor(2) as executor:
+            results = list(
+                executor.map(
+                    lookup, ["minor_radius", "safety_factor"], [block.name] * 2
+                )
+            )
+        assert results[0][0] != os.getpid()
+        assert results[0][1] == catalogue["minor_radius"].as_dict()
+        assert results[1][1]["documentation"] == "Safety factor."
+        with SharedCatalogue.attach_shared(block.name) as shared:
+            assert shared.is_current()
+    finally:
+        block.close()
+        if sys.version_info < (3, 13):  # attaching unregistered the creator's block
+            resource_tracker.register(block._name, "shared_memory")
+        block.unlink()
+    assert not shared.is_current()
+
+
+def test_cli(tmp_path):
+    filename = tmp_path / "standardnames.yml"
+    filename.write_text(yaml_data.as_yaml())
+    result = CliRunner().invoke(
+        publish_standardnames, [str(filename), str(tmp_path / "catalogue.img")]
+    )
+    assert result.exit_code == 0
+    assert "Published 4 standard names" in result.output
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
@@ -0,0 +1,141 @@
+from pathlib import Path
+import subprocess
+
+from click.testing import CliRunner
+import pytest
+
+from imas_standard_names.scripts import snapshot_standardnames
+from imas_standard_names.snapshot import SnapshotStore
+from imas_standard_names.standard_name import StandardNameFile
+
+versions = [
+    """\
+plasma_current:
+  units: A
+  documentation: docs
+""",
+    """\
+plasma_current:
+  units: A
+  documentation: docs
+poloidal_flux:
+  units: Wb
+  documentation: Poloidal flux.
+""",
+    "plasma_current: [unbalanced\n",
+    """\
+plasma_current:
+  units: A
+  documentation: docs
+poloidal_flux:
+  units: Wb
+  documentation: Poloidal magnetic flux.
+  links:
+  - issue/3
+""",
+]
+
+
+def git(repo: Path, *args: str) -> str:
+    """Run git command in repo and return stdout."""
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Return local git repository with a history of standard name edits."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q")
+    git(repo, "config", "user.name", "test")
+    git(repo, "config", "user.email", "test@example.com")
+    for number, text in enumerate(versions):
+        (repo / "standardnames.yml").write_text(text)
+        git(repo, "add", "standardnames.yml")
+        git(repo, "commit", "-q", "-m", f"version {number}")
+        if number == 1:
+            git(repo, "tag", "v0.1")
+    (repo / "README.md").write_text("readme")
+    git(repo, "add", "README.md")
+    git(repo, "commit", "-q", "-m", "readme")
+    return repo
+
+
+@pytest.fixture
+def store(repo, tmp_path):
+    store = SnapshotStore(tmp_path / "store")
+    store.import_git(repo)
+    return store
+
+
+def test_import(repo, store):
+    commits = git(repo, "log", "--reverse", "--format=%H").split()
+    assert list(store.versions) == [commits[0], commits[1], commits[3]]
+    assert store.tags == {"v0.1": commits[1]}
+
+
+def test_shared_objects(store):
+    objects = list((store.path / "objects").glob("*/*.json"))
+    assert len(objects) == 3
+
+
+def test_load(store):
+    assert store.load("v0.1")["poloidal_flux"] == {
+        "units": "Wb",
+        "documentation": "Poloidal flux.",
+    }
+    assert store.entry("v0.1", "plasma_current")["units"] == "A"
+    assert store.catalogue("v0.1")["poloidal_flux"].units == "Wb"
+
+
+def test_hashes_match_file(repo, store):
+    latest = list(store.versions)[-1]
+    assert (
+        store.manifest(latest) == StandardNameFile(repo / "standardnames.yml").hashes()
+    )
+
+
+def test_history(store):
+    history = store.history("poloidal_flux")
+    assert [data["documentation"] for _, data in history] == [
+        "Poloidal flux.",
+        "Poloidal magnetic flux.",
+    ]
+    assert history[1][1]["links"] == ["issue/3"]
+    assert len(store.history("plasma_current")) == 1
+
+
+def test_resolve(store):
+    latest = list(store.versions)[-1]
+    assert store.resolve(latest[:10]) == latest
+    with pytest.raises(KeyError):
+        store.resolve("v9.9")
+
+
+def test_reopen(repo, store):
+    reopened = SnapshotStore(store.path)
+    assert reopened.versions == store.versions
+    assert reopened.tags == store.tags
+    assert reopened.load("v0.1") == store.load("v0.1")
+    assert reopened.import_git(repo) == []
+
+
+def test_incremental_import(repo, store):
+    (repo / "standardnames.yml").write_text(versions[0])
+    git(repo, "commit", "-q", "-am", "revert")
+    assert len(store.import_git(repo)) == 1
+    assert store.history("poloidal_flux")[-1][1] is None
+
+
+def test_cli(repo, tmp_path):
+    result = CliRunner().invoke(
+        snapshot_standardnames, (repo.as_posix(), (tmp_path / "cli").as_posix())
+    )
+    assert result.exit_code == 0
+    assert "Imported 3 versions" in result.output
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
@@ -0,0 +1,184 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+from pathlib import Path
+import subprocess
+
+from click.testing import CliRunner
+import pandas
+import pytest
+import strictyaml as syaml
+
+from imas_standard_names.scripts import drain_standardnames, queue_standardname
+from imas_standard_names.spool import SubmissionQueue
+from imas_standard_names.standard_name import StandardNameFile
+
+issue_url = "https://github.com/iterorganization/IMAS-Standard-Names/issues"
+
+standardnames = syaml.as_document(
+    {
+        name: {"units": units, "documentation": "docs"}
+        for name, units in zip(["plasma_current", "electron_temperature"], ["A", "eV"])
+    }
+)
+
+genericnames = pandas.DataFrame(
+    [("m^2", "area"), ("A", "current")], columns=["Unit", "Generic Name"]
+)
+
+
+def git(repo: Path, *args: str) -> str:
+    """Run git command in repo and return stdout."""
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Return local git repository holding a committed standard names file."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q")
+    git(repo, "config", "user.name", "test")
+    git(repo, "config", "user.email", "test@example.com")
+    with open(repo / "standardnames.yml", "w") as f:
+        f.write(standardnames.as_yaml())
+    with open(repo / "generic_names.csv", "w", newline="") as f:
+        genericnames.to_csv(f, index=False)
+    git(repo, "add", ".")
+    git(repo, "commit", "-q", "-m", "initial")
+    return repo
+
+
+def write_submission(path: Path, name: str, **kwargs) -> Path:
+    """Write issue form submission to a json file."""
+    submission_file = path / f"{name}.json"
+    with open(submission_file, "w") as f:
+        json.dump(
+            {"name": name, "units": "m", "documentation": "docs", "options": []}
+            | kwargs,
+            f,
+        )
+    return submission_file
+
+
+def test_put(tmp_path):
+    queue = SubmissionQueue(tmp_path / "spool")
+    queue.put(write_submission(tmp_path, "major_radius"), f"{issue_url}/1")
+    assert len(queue) == 1
+
+
+def test_concurrent_put(tmp_path):
+    queue = SubmissionQueue(tmp_path / "spool")
+    names = [f"radius_{i}" for i in range(16)]
+    submissions = [write_submission(tmp_path, name) for name in names]
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(queue.put, submissions))
+    assert len(queue) == 16
+
+
+def test_put_same_timestamp(tmp_path, monkeypatch):
+    monkeypatch.setattr("imas_standard_names.spool.time.time_ns", lambda: 1)
+    queue = SubmissionQueue(tmp_path / "spool")
+    submissions = [write_submission(tmp_path, f"radius_{i}") for i in range(8)]
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(queue.put, submissions))
+    assert len(queue) == 8
+
+
+def test_put_order(tmp_path):
+    queue = SubmissionQueue(tmp_path / "spool")
+    spooled = [queue.put(write_submission(tmp_path, f"radius_{i}")) for i in range(8)]
+    assert list(queue) == spooled
+
+
+def test_drain_empty(tmp_path, repo):
+    queue = SubmissionQueue(tmp_path / "spool")
+    drained = queue.drain(repo / "standardnames.yml", repo / "generic_names.csv")
+    assert not drained
+    assert not git(repo, "status", "--porcelain")
+
+
+def test_drain(tmp_path, repo):
+    queue = SubmissionQueue(tmp_path / "spool")
+    for i, name in enumerate(["major_radius", "minor_radius"]):
+        queue.put(write_submission(tmp_path, name), f"{issue_url}/{i}")
+    drained = queue.drain(repo / "standardnames.yml", repo / "generic_names.csv")
+    assert len(drained) == 2
+    assert len(queue) == 0
+    standard_names = StandardNameFile(repo / "standardnames.yml")
+    assert "major_radius" in standard_names.data
+    assert "minor_radius" in standard_names.data
+    assert standard_names["minor_radius"].links == [f"{issue_url}/1"]
+
+
+def test_drain_errors(tmp_path, repo):
+    queue = SubmissionQueue(tmp_path / "spool")
+    queue.put(write_submission(tmp_path, "major_radius"), f"{issue_url}/1")
+    queue.put(write_submission(tmp_path, "plasma_current"), f"{issue_url}/2")
+    queue.put(write_submission(tmp_path, "area"), f"{issue_url}/3")
+    drained = queue.drain(repo / "standardnames.yml", repo / "generic_names.csv")
+    assert [standard_name.name for standard_name in drained.standard_names] == [
+        "major_radius"
+    ]
+    assert len(drained.errors) == 2
+    assert len(list(queue.failed.glob("*.json"))) == 2
+    assert len(queue) == 0
+
+
+def test_drain_overwrite(tmp_path, repo):
+    queue = SubmissionQueue(tmp_path / "spool")
+    queue.put(
+        write_submission(tmp_path, "plasma_current", units="MA"),
+        f"{issue_url}/4",
+        overwrite=True,
+    )
+    queue.drain(repo / "standardnames.yml", repo / "generic_names.csv")
+    assert StandardNameFile(repo / "standardnames.yml")["plasma_current"].units == "MA"
+
+
+def test_commit_message(tmp_path, repo):
+    queue = SubmissionQueue(tmp_path / "spool")
+    for i, name in enumerate(["major_radius", "minor_radius"]):
+        queue.put(write_submission(tmp_path, name), f"{issue_url}/{i}")
+    drained = queue.drain(repo / "standardnames.yml", repo / "generic_names.csv")
+    drained.commit(repo / "standardnames.yml")
+    message = git(repo, "log", "-1", "--format=%B")
+    assert message.startswith("Add 2 Standard Names :rocket:")
+    assert f"- major_radius Closes {issue_url}/0" in message
+    assert f"- minor_radius Closes {issue_url}/1" in message
+    assert git(repo, "rev-list", "--count", "HEAD").strip() == "2"
+
+
+def test_cli(tmp_path, repo):
+    runner = CliRunner()
+    spool_dir = (tmp_path / "spool").as_posix()
+    for i, name in enumerate(["major_radius", "minor_radius"]):
+        result = runner.invoke(
+            queue_standardname,
+            (
+                spool_dir,
+                write_submission(tmp_path, name).as_posix(),
+                "--issue-link",
+                f"{issue_url}/{i}",
+            ),
+        )
+        assert result.exit_code == 0
+    result = runner.invoke(
+        drain_standardnames,
+        (
+            spool_dir,
+            (repo / "standardnames.yml").as_posix(),
+            (repo / "generic_names.csv").as_posix(),
+            "--commit",
+        ),
+    )
+    assert result.exit_code == 0
+    assert "Add 2 Standard Names" in result.output
+    assert git(repo, "log", "-1", "--format=%s").strip() == (
+        "Add 2 Standard Names :rocket:"
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
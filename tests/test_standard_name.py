@@ -162,6 +162,11 @@ def test_units_unit_format(units, unit_format):
     assert standard_name.units == f"{pint.Unit(units):{unit_format}}"
 
 
+@pytest.mark.parametrize("units", ["kg.m^-2.s^-1", "m^2.s^-1", "m^-2.sr^-1.W"])
+def test_units_parser_roundtrip(units):
+    assert StandardName.parse_units(units) == units
+
+
 def test_units_parser_error():
     with pytest.raises(pint.errors.UndefinedUnitError):
         StandardName(name="electron_temperature", units="eVv", documentation="docs")
@@ -318,6 +323,114 @@ def test_unique_links(standardnames):
     assert len(standard_names["plasma_current"].links) == 4
 
 
+@pytest.fixture
+def layout_file(tmp_path):
+    filepath = tmp_path / "standardnames.yml"
+    with open(filepath, "w") as f:
+        f.write(
+            "time:\n  units: s\n  tags:\n    - time\n  documentation: |\n"
+            "    Elapsed time.\n\n"
+            "plasma_current:\n  units: A\n  documentation: Plasma current.\n\n"
+            "electron_temperature:\n  units: eV\n  documentation: Te."
+        )
+    return filepath
+
+
+def read(filepath) -> str:
+    with open(filepath) as f:
+        return f.read()
+
+
+def test_file_update_append(layout_file):
+    original = read(layout_file)
+    standard_names = StandardNameFile(layout_file)
+    standard_name = StandardName(**standard_name_data)
+    standard_names.update(standard_name)
+    assert read(layout_file) == original + "\n" + standard_name.as_yaml()
+    assert StandardNameFile(layout_file)[standard_name.name] == standard_name
+
+
+def test_file_update_splice(layout_file):
+    original = read(layout_file)
+    standard_names = StandardNameFile(layout_file)
+    standard_name = StandardName(
+        name="plasma_current", units="MA", documentation="docs", links="issue/1"
+    )
+    standard_names.update(standard_name, overwrite=True)
+    content = read(layout_file)
+    assert content.startswith(original[: original.index("plasma_current:")])
+    assert content.endswith(original[original.index("\n\nelectron_temperature") :])
+    assert StandardNameFile(layout_file)["plasma_current"] == standard_name
+
+
+def test_file_update_sequence(layout_file):
+    standard_names = StandardNameFile(layout_file)
+    for name, units, overwrite in [
+        ("ion_temperature", "eV", False),
+        ("time", "ms", True),
+        ("electron_temperature", "K", True),
+        ("plasma_current", "kA", True),
+        ("ion_temperature", "K", True),
+    ]:
+        standard_names.update(
+            StandardName(name=name, units=units, documentation="docs"),
+            overwrite=overwrite,
+        )
+    reloaded = StandardNameFile(layout_file)
+    assert list(reloaded.data.data) == list(standard_names.data.data)
+    for name in reloaded.data.data:
+        assert reloaded[name] == standard_names[name]
+
+
+def test_file_update_ambiguous_layout(layout_file):
+    with open(layout_file, "a") as f:
+        f.write("\n# trailing comment\n")
+    standard_names = StandardNameFile(layout_file)
+    standard_names.update(StandardName(**standard_name_data))
+    assert read(layout_file) == standard_names.data.as_yaml()
+
+
+def test_file_update_external_change(layout_file):
+    standard_names = StandardNameFile(layout_file)
+    with open(layout_file, "a") as f:
+        f.write("\nmajor_radius:\n  documentation: R0\n")
+    content = read(layout_file)
+    with pytest.raises(RuntimeError, match="changed on disk"):
+        standard_names.update(StandardName(**standard_name_data))
+    assert read(layout_file) == content
+    assert standard_name_data["name"] not in standard_names.data
+    with pytest.raises(RuntimeError, match="changed on disk"):
+        standard_names.update(StandardName(**standard_name_data))
+    with pytest.raises(RuntimeError, match="changed on disk"):
+        standard_names.update_batch([StandardName(**standard_name_data)])
+    assert standard_name_data["name"] not in standard_names.data
+    reloaded = StandardNameFile(layout_file)
+    reloaded.update(StandardName(**standard_name_data))
+    assert "major_radius" in read(layout_file)
+    assert standard_name_data["name"] in StandardNameFile(layout_file).data
+
+
+def test_file_write_external_change(layout_file):
+    standard_names = StandardNameFile(layout_file)
+    with open(layout_file, "a") as f:
+        f.write("\nmajor_radius:\n  documentation: R0\n")
+    with pytest.raises(RuntimeError, match="changed on disk"):
+        standard_names.write()
+    assert "major_radius" in read(layout_file)
+
+
+def test_file_update_after_unsaved_update(layout_file):
+    standard_names = StandardNameFile(layout_file)
+    standard_names.update(
+        StandardName(name="minor_radius", units="m", documentation="a"),
+        update_file=False,
+    )
+    standard_names.update(StandardName(**standard_name_data))
+    reloaded = StandardNameFile(layout_file)
+    assert "minor_radius" in reloaded.data
+    assert standard_name_data["name"] in reloaded.data
+
+
 @pytest.fixture(scope="session")
 def generic_names(tmp_path_factory):
     filepath = tmp_path_factory.mktemp("data") / "generic_names.csv"
@@ -353,5 +466,12 @@ def test_json_roundtrip():
     )
 
 
+def test_hashes():
+    hashes = ParseYaml(yaml_multi.as_yaml()).hashes()
+    assert list(hashes) == list(yaml_multi.data)
+    assert len(set(hashes.values())) == 3
+    assert hashes == ParseYaml(yaml_multi.as_yaml()).hashes()
+
+
 if __name__ == "__main__":  # pragma: no cover
     pytest.main([__file__])
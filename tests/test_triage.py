@@ -0,0 +1,190 @@
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import subprocess
+import sys
+import threading
+
+from click.testing import CliRunner
+import pandas
+import pytest
+import strictyaml as syaml
+
+from imas_standard_names.scripts import triage_standardnames
+from imas_standard_names.triage import (
+    Comment,
+    DirectorySink,
+    GitHubSink,
+    load,
+    triage,
+    triage_submission,
+)
+
+issue_url = "https://github.com/iterorganization/IMAS-Standard-Names/issues"
+
+standardnames = syaml.as_document(
+    {
+        "plasma_current": {
+            "units": "A",
+            "documentation": "docs",
+            "links": [f"{issue_url}/1"],
+        },
+    }
+)
+
+genericnames = pandas.DataFrame(
+    [("m^2", "area"), ("A", "current")], columns=["Unit", "Generic Name"]
+)
+
+submissions = {
+    "11": {"name": "ion_temperature", "units": "eV", "documentation": "docs"},
+    "12": {"name": "area", "units": "m^2", "documentation": "docs"},
+    "13": {"name": "plasma_current", "units": "MA", "documentation": "docs"},
+    "14": {
+        "name": "plasma_current",
+        "units": "MA",
+        "documentation": "docs",
+        "options": ["This is a proposal to overwrite an existing Standard Name"],
+        "issue_link": f"{issue_url}/14",
+    },
+}
+
+
+@pytest.fixture
+def files(tmp_path):
+    standardnames_file = tmp_path / "standardnames.yml"
+    standardnames_file.write_text(standardnames.as_yaml())
+    genericnames_file = tmp_path / "generic_names.csv"
+    genericnames.to_csv(genericnames_file, index=False)
+    submission_dir = tmp_path / "submissions"
+    submission_dir.mkdir()
+    for number, submission in submissions.items():
+        with open(submission_dir / f"{number}.json", "w") as f:
+            json.dump({"tags": "", "alias": "", "options": []} | submission, f)
+    return submission_dir, standardnames_file, genericnames_file
+
+
+class RecordingSink:
+    """Collect comments in memory."""
+
+    def __init__(self):
+        self.comments = []
+
+    async def send(self, comment: Comment):
+        self.comments.append(comment)
+
+
+def test_triage_submission(files):
+    submission_dir, standardnames_file, genericnames_file = files
+    load(standardnames_file, genericnames_file, "~F")
+    comment = triage_submission(submission_dir / "14.json")
+    assert comment.valid
+    assert ":sparkles:" in comment.body
+    assert f"{issue_url}/1" in comment.body
+    assert f"{issue_url}/14" in comment.body
+    assert comment.issue_number == 14
+
+
+def test_catalogue_unchanged(files):
+    submission_dir, standardnames_file, genericnames_file = files
+    load(standardnames_file, genericnames_file, "~F")
+    assert triage_submission(submission_dir / "11.json").valid
+    assert triage_submission(submission_dir / "11.json").valid
+    assert standardnames_file.read_text() == standardnames.as_yaml()
+
+
+def test_triage(files):
+    sink = RecordingSink()
+    comments = asyncio.run(triage(*files, sink, max_workers=2))
+    assert [comment.submission_file.stem for comment in comments] == [
+        "11",
+        "12",
+        "13",
+        "14",
+    ]
+    assert [comment.valid for comment in comments] == [True, False, False, True]
+    assert "is a generic name" in comments[1].body
+    assert ":boom: The proposed Standard Name is not valid." in comments[2].body
+    assert "already present" in comments[2].body
+    assert len(sink.comments) == 4
+
+
+def test_directory_sink(files, tmp_path):
+    asyncio.run(triage(*files, DirectorySink(tmp_path / "comments"), max_workers=1))
+    assert ":sparkles:" in (tmp_path / "comments" / "11.md").read_text()
+    assert ":boom:" in (tmp_path / "comments" / "12.md").read_text()
+
+
+@pytest.fixture
+def github():
+    """Run a local stub of the GitHub issue comments endpoint."""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            requests.append((self.path, self.headers["Authorization"], body["body"]))
+            self.send_response(201)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", requests
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_github_sink(files, github):
+    api_url, requests = github
+    sink = GitHubSink("owner/repo", token="secret", api_url=api_url)
+    asyncio.run(triage(*files, sink, max_workers=2))
+    assert sorted(path for path, _, _ in requests) == [
+        f"/repos/owner/repo/issues/{number}/comments" for number in submissions
+    ]
+    assert {token for _, token, _ in requests} == {"Bearer secret"}
+
+
+def test_github_sink_error(files):
+    sink = GitHubSink("owner/repo", api_url="http://127.0.0.1:1", timeout=1)
+    comments = asyncio.run(triage(*files, sink, max_workers=1))
+    assert all("URLError" in comment.sink_error for comment in comments)
+
+
+def test_cli(files, github, monkeypatch):
+    api_url, requests = github
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    result = CliRunner().invoke(
+        triage_standardnames,
+        [str(file) for file in files]
+        + ["--github-repository", "owner/repo", "--github-api-url", api_url],
+    )
+    assert result.exit_code == 0
+    assert "2 valid, 2 invalid submissions." in result.output
+    assert len(requests) == 4
+
+
+def test_library_imports():
+    script = (
+        "import sys\n"
+        "import imas_standard_names.triage\n"
+        "print(sorted({'click', 'imas_standard_names.scripts'} & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
@@ -0,0 +1,114 @@
+from pathlib import Path
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+import strictyaml as syaml
+
+import imas_standard_names
+from imas_standard_names import units
+from imas_standard_names.standard_name import ParseYaml
+
+yaml_data = syaml.as_document(
+    {
+        "plasma_current": {"units": "A", "documentation": "docs"},
+        "electron_temperature": {"units": "K", "documentation": "docs"},
+        "poloidal_flux": {"units": "Wb", "documentation": "docs"},
+        "safety_factor": {"documentation": "docs"},
+    },
+    schema=ParseYaml.schema,
+)
+
+
+@pytest.fixture
+def standard_names():
+    return ParseYaml(yaml_data.as_yaml())
+
+
+@pytest.mark.parametrize(
+    "source,target,factors",
+    [("kA", "A", (1e3, 0)), ("m.s^-1", "km/s", (1e-3, 0)), ("degC", "K", (1, 273.15))],
+)
+def test_conversion_factors(source, target, factors):
+    assert units.conversion_factors(source, target) == pytest.approx(factors)
+
+
+def test_conversion_factors_cached():
+    units.conversion_factors.cache_clear()
+    units.conversion_factors("mA", "A")
+    units.conversion_factors("mA", "A")
+    assert units.conversion_factors.cache_info().hits == 1
+
+
+def test_convert(standard_names):
+    values = np.array([1.0, 2.5])
+    assert np.allclose(
+        standard_names.convert("plasma_current", values, "MA"), [1e6, 2.5e6]
+    )
+
+
+def test_convert_offset(standard_names):
+    values = np.array([0.0, 100.0])
+    assert np.allclose(
+        standard_names.convert("electron_temperature", values, "degC"),
+        [273.15, 373.15],
+    )
+
+
+def test_convert_dimensionless(standard_names):
+    values = np.array([0.5, 1.5])
+    assert np.allclose(standard_names.convert("safety_factor", values, "none"), values)
+
+
+def test_convert_out(standard_names):
+    values = np.arange(4.0)
+    out = np.empty_like(values)
+    result = standard_names.convert("poloidal_flux", values, "mWb", out=out)
+    assert result is out
+    assert np.allclose(out, 1e-3 * values)
+
+
+def test_convert_in_place(standard_names):
+    values = np.arange(4.0)
+    result = standard_names.convert("plasma_current", values, "kA", out=values)
+    assert result is values
+    assert np.allclose(values, 1e3 * np.arange(4.0))
+
+
+def test_convert_dimensionality_error(standard_names):
+    with pytest.raises(units.pint.errors.DimensionalityError):
+        standard_names.convert("plasma_current", np.ones(2), "m")
+
+
+def test_convert_unknown_name(standard_names):
+    with pytest.raises(KeyError):
+        standard_names.convert("plasma_volume", np.ones(2), "m^3")
+
+
+def test_convert_batch(standard_names):
+    out = {"poloidal_flux": np.empty(3)}
+    result = standard_names.convert_batch(
+        {"plasma_current": np.ones(2), "poloidal_flux": np.ones(3)},
+        {"plasma_current": "kA", "poloidal_flux": "mWb"},
+        out=out,
+    )
+    assert np.allclose(result["plasma_current"], 1e3)
+    assert result["poloidal_flux"] is out["poloidal_flux"]
+    assert np.allclose(result["poloidal_flux"], 1e-3)
+
+
+def test_package_registers_unit_format():
+    script = "import imas_standard_names, pint\nprint(f\"{pint.Unit('m/s'):~F}\")\n"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(imas_standard_names.__file__).parents[1],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "m.s^-1"
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])
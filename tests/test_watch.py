@@ -0,0 +1,159 @@
+import os
+from pathlib import Path
+import threading
+import time
+
+import pytest
+
+from imas_standard_names.watch import InotifyMonitor, StatMonitor, Watcher
+
+standardnames = """\
+radial_distance:
+  units: m
+  documentation: Distance from the central axis.
+vertical_distance:
+  units: m
+  documentation: |
+    Vertical distance. See [`radial_distance`](#radial_distance).
+minor_radius:
+  units: m
+  alias: radial_distance
+  documentation: Minor radius.
+"""
+
+
+def write(filename: Path, text: str):
+    """Write text to file, bumping mtime so stat polling sees the change."""
+    stat = filename.stat() if filename.exists() else None
+    with open(filename, "w") as f:
+        f.write(text)
+    if stat is not None:
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def filename(tmp_path):
+    filename = tmp_path / "standardnames.yml"
+    write(filename, standardnames)
+    return filename
+
+
+def test_initial(filename):
+    watcher = Watcher(filename)
+    assert watcher.names == {"radial_distance", "vertical_distance", "minor_radius"}
+    assert not watcher.errors
+    assert watcher.entries["minor_radius"].alias == "radial_distance"
+
+
+def test_unchanged(filename):
+    watcher = Watcher(filename)
+    assert watcher.refresh() == {}
+
+
+def test_changed_block(filename):
+    watcher = Watcher(filename)
+    write(filename, standardnames.replace("Minor radius.", "Minor radius [m]."))
+    assert watcher.refresh() == {"minor_radius": None}
+    assert watcher.entries["minor_radius"].documentation == "Minor radius [m]."
+
+
+def test_invalid_block(filename):
+    watcher = Watcher(filename)
+    write(filename, standardnames.replace("minor_radius:", "Minor_radius:"))
+    status = watcher.refresh()
+    assert "is *not* valid" in status["Minor_radius"]
+    assert status["minor_radius"] is None
+    assert "Minor_radius" in watcher.errors
+
+
+def test_invalid_units(filename):
+    watcher = Watcher(filename)
+    write(filename, standardnames.replace("units: m\n  alias", "units: mm_\n  alias"))
+    assert "UndefinedUnitError" in watcher.refresh()["minor_radius"]
+
+
+def test_removed_dependencies(filename):
+    watcher = Watcher(filename)
+    text = standardnames.replace("radial_distance:\n", "major_radius:\n", 1)
+    write(filename, text)
+    status = watcher.refresh()
+    assert set(status) == {
+        "radial_distance",
+        "major_radius",
+        "vertical_distance",
+        "minor_radius",
+    }
+    assert "alias **radial_distance**" in status["minor_radius"]
+    assert "links to **radial_distance**" in status["vertical_distance"]
+    write(filename, standardnames)
+    status = watcher.refresh()
+    assert not watcher.errors
+    assert status["minor_radius"] is None
+
+
+def test_ambiguous_layout(filename):
+    watcher = Watcher(filename)
+    write(filename, "# comment\n" + standardnames)
+    watcher.refresh()
+    write(filename, "# comment\n" + standardnames.replace("Minor", "The minor"))
+    assert watcher.refresh() == {"minor_radius": None}
+
+
+def test_syntax_error(filename):
+    watcher = Watcher(filename)
+    write(filename, "# comment\n" + standardnames + "  - [unbalanced\n")
+    assert "" in watcher.refresh()
+    write(filename, standardnames)
+    watcher.refresh()
+    assert not watcher.errors
+
+
+def test_bounded_state(filename):
+    watcher = Watcher(filename)
+    for index in range(20):
+        text = standardnames.replace("alias: radial_distance", f"alias: radius_{index}")
+        write(filename, text)
+        watcher.refresh()
+    assert set(watcher._dependents) == {"radial_distance", "radius_19"}
+
+
+@pytest.mark.parametrize("monitor_class", [StatMonitor, InotifyMonitor])
+def test_monitor(filename, monitor_class):
+    try:
+        file_monitor = monitor_class(filename)
+    except OSError:  # pragma: no cover
+        pytest.skip("inotify not available")
+    try:
+        assert not file_monitor.wait(0.05)
+        write(filename, standardnames + "\n")
+        assert file_monitor.wait(1)
+        assert not file_monitor.wait(0.05)
+    finally:
+        file_monitor.close()
+
+
+def test_watch(filename):
+    watcher = Watcher(filename)
+    results, stop = [], threading.Event()
+
+    def callback(status):
+        results.append(status)
+        stop.set()
+
+    thread = threading.Thread(
+        target=watcher.watch,
+        kwargs={"interval": 0.05, "callback": callback, "stop": stop},
+    )
+    thread.start()
+    try:
+        time.sleep(0.2)
+        write(filename, standardnames.replace("Minor radius.", "Minor."))
+        thread.join(5)
+    finally:
+        stop.set()
+        thread.join()
+    assert results == [{"minor_radius": None}]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main([__file__])